@@ -3,6 +3,8 @@
 Table Manager - Handles the games table UI operations
 """
 
+import functools
+import os
 from typing import List
 
 from PyQt6.QtCore import QObject, Qt, pyqtSignal, QRect
@@ -15,6 +17,26 @@ from utils.ui_utils import UIUtils
 from widgets.icon_delegate import IconDelegate
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_row_icon(path: str, mtime_ns: int, size: int) -> QPixmap:
+    """Load and scale a cached game icon, memoized by path, mtime and size
+
+    Re-populating the table (re-scan, platform switch, sort reset) would
+    otherwise decode and smooth-scale every PNG again.
+    """
+    # Cached icons are PNGs; only fall back to format detection if not
+    pixmap = QPixmap()
+    if not pixmap.load(path, "PNG") and not pixmap.load(path):
+        return pixmap
+    # Scale to 64x64 for better visibility
+    return pixmap.scaled(
+        64,
+        64,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
+
 class NonSortableHeaderView(QHeaderView):
     """Custom header view to disable sorting and indicators on specific sections"""
 
@@ -450,15 +472,9 @@ class TableManager(QObject):
         icon_path = GameManager.get_icon_path(self, game.title_id)
         if icon_path:
             try:
-                pixmap = QPixmap(icon_path)
-                if not pixmap.isNull():
-                    # Scale to 64x64 for better visibility
-                    scaled_pixmap = pixmap.scaled(
-                        64,
-                        64,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation,
-                    )
+                st = os.stat(icon_path)
+                scaled_pixmap = _cached_row_icon(icon_path, st.st_mtime_ns, st.st_size)
+                if not scaled_pixmap.isNull():
                     icon_item.setIcon(QIcon(scaled_pixmap))
             except Exception as e:
                 print(f"Failed to load icon for {game.title_id}: {e}")
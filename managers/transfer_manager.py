@@ -55,6 +55,7 @@ class TransferManager(QObject):
                 ftp_settings["password"],
                 target_directory,
                 ftp_settings.get("port", 21),
+                buffer_size=ftp_settings.get("buffer_size", 256 * 1024),
                 current_platform=current_platform,
             )
         else:
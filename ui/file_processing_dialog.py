@@ -8,9 +8,7 @@ import gc
 import os
 import shutil
 import tempfile
-import threading
 import time
-import zipfile
 
 from PyQt6.QtCore import QProcess, Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
@@ -25,6 +23,7 @@ from PyQt6.QtWidgets import (
 )
 
 from utils.system_utils import SystemUtils
+from workers.zip_extract import ZipExtractorWorker
 
 
 def _is_file_in_use(filepath):
@@ -462,95 +461,79 @@ class FileProcessingDialog(QDialog):
         self._extract_zip_builtin(self._on_zip_extraction_complete_for_god)
 
     def _extract_zip_builtin(self, completion_callback):
-        """Extract ZIP using Python's built-in zipfile module"""
-
-        def extract_zip():
-            zip_ref = None
-            try:
-                # Check for cancellation before starting
-                if self.cancel_zip_extraction:
-                    return
-
-                # Emit simple progress messages
-                self.zip_progress_message.emit("Extracting files...")
-
-                zip_ref = zipfile.ZipFile(self.original_path, "r")
-                file_list = zip_ref.infolist()
-                total_files = len(file_list)
-
-                for i, file_info in enumerate(file_list):
-                    # Check for cancellation
-                    if self.cancel_zip_extraction:
-                        self.zip_progress_message.emit("Extraction cancelled")
-                        break
-
-                    # Extract each file
-                    zip_ref.extract(file_info, self.temp_dir)
-                    # Show simple progress - only occasionally to avoid spam
-                    if i % 10 == 0 or i == total_files - 1:
-                        progress_msg = f"Extracting file {i + 1}/{total_files}..."
-                        self.zip_progress_message.emit(progress_msg)
-
-                # Close the zip file explicitly before proceeding
-                if zip_ref:
-                    zip_ref.close()
-                    zip_ref = None
-
-                # Check for cancellation after extraction
-                if self.cancel_zip_extraction:
-                    return
-
-                self.zip_progress_message.emit("Files extracted")
-
-                # Find the ISO file in the extracted contents
-                iso_files = []
-                for root, dirs, files in os.walk(self.temp_dir):
-                    # Check for cancellation during file search
-                    if self.cancel_zip_extraction:
-                        return
-                    for file in files:
-                        if file.lower().endswith(".iso"):
-                            iso_files.append(os.path.join(root, file))
-
-                if iso_files:
-                    self.temp_iso_path = iso_files[0]  # Use the first ISO found
-                    self.input_path = self.temp_iso_path
-
-                    iso_name = os.path.basename(self.temp_iso_path)
-                    self.zip_progress_message.emit(f"Found ISO: {iso_name}")
-
-                    # Call the completion callback only if not cancelled
-                    if not self.cancel_zip_extraction:
-                        QTimer.singleShot(100, completion_callback)
-                else:
-                    if not self.cancel_zip_extraction:
-                        self.zip_progress_message.emit("ERROR: No ISO file found")
-                        QTimer.singleShot(
-                            100,
-                            lambda: self._show_error(
-                                "No ISO file found in ZIP archive"
-                            ),
-                        )
-
-            except Exception as ex:
-                if not self.cancel_zip_extraction:
-                    error_msg = f"Failed to extract ZIP: {str(ex)}"
-                    print(f"ZIP extraction error: {error_msg}")
-                    self.zip_progress_message.emit(f"ERROR: {error_msg}")
-                    QTimer.singleShot(100, lambda: self._show_error(error_msg))
-            finally:
-                # Explicitly close the ZIP file to release handles
-                if zip_ref:
-                    try:
-                        zip_ref.close()
-                    except Exception:
-                        pass
+        """Extract the ZIP's ISO into temp_dir on a ZipExtractorWorker
+
+        The worker only writes out the archive's ISO when it has one,
+        streams members in large chunks and checks their CRCs, so the ZIP
+        is no longer unpacked member by member with ZipFile.extract.
+        """
+        # Check for cancellation before starting
+        if self.cancel_zip_extraction:
+            return
 
-        # Start extraction in a separate thread
-        self.zip_extraction_thread = threading.Thread(target=extract_zip)
-        self.zip_extraction_thread.daemon = True
+        # Emit simple progress messages
+        self.zip_progress_message.emit("Extracting files...")
+
+        self._zip_completion_callback = completion_callback
+        self.zip_extraction_thread = ZipExtractorWorker(
+            self.original_path, self.temp_dir
+        )
+        # Parented to the dialog so dropping the reference (a reset, or a
+        # new ZIP in batch mode) can't destroy the thread while it runs
+        self.zip_extraction_thread.setParent(self)
+        self.zip_extraction_thread.progress.connect(self._on_zip_extraction_progress)
+        self.zip_extraction_thread.extraction_complete.connect(
+            self._on_zip_extraction_finished
+        )
+        self.zip_extraction_thread.extraction_error.connect(
+            self._on_zip_extraction_error
+        )
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
         self.zip_extraction_thread.start()
 
+    def _on_zip_extraction_progress(self, percent: int):
+        """Show the ZIP extraction's progress"""
+        if self.cancel_zip_extraction:
+            return
+        self.progress_bar.setValue(percent)
+        self.status_label.setText(f"Extracting ZIP archive... {percent}%")
+
+    def _on_zip_extraction_finished(self, extracted_path: str):
+        """Continue with the ISO the ZIP extraction produced"""
+        if self.cancel_zip_extraction:
+            return
+
+        # Back to indeterminate for the xdvdfs / GOD step
+        self.progress_bar.setRange(0, 0)
+        self.zip_progress_message.emit("Files extracted")
+
+        # The worker hands back the extraction directory when there's no ISO
+        if not (
+            extracted_path.lower().endswith(".iso") and os.path.isfile(extracted_path)
+        ):
+            self.zip_progress_message.emit("ERROR: No ISO file found")
+            self._show_error("No ISO file found in ZIP archive")
+            return
+
+        self.temp_iso_path = extracted_path
+        self.input_path = self.temp_iso_path
+
+        iso_name = os.path.basename(self.temp_iso_path)
+        self.zip_progress_message.emit(f"Found ISO: {iso_name}")
+
+        self._zip_completion_callback()
+
+    def _on_zip_extraction_error(self, error: str):
+        """Report a failed ZIP extraction"""
+        if self.cancel_zip_extraction:
+            return
+        error_msg = f"Failed to extract ZIP: {error}"
+        print(f"ZIP extraction error: {error_msg}")
+        self.progress_bar.setRange(0, 0)
+        self.zip_progress_message.emit(f"ERROR: {error_msg}")
+        self._show_error(error_msg)
+
     def _on_zip_progress_message(self, message: str):
         """Handle ZIP progress messages from background thread"""
         self.output_text.append(message)
@@ -774,9 +757,10 @@ class FileProcessingDialog(QDialog):
         if (
             hasattr(self, "zip_extraction_thread")
             and self.zip_extraction_thread
-            and self.zip_extraction_thread.is_alive()
+            and self.zip_extraction_thread.isRunning()
         ):
             self.cancel_zip_extraction = True
+            self.zip_extraction_thread.stop()
             self.status_label.setText("Cancelling ZIP extraction...")
             self.cancel_button.setEnabled(False)
 
@@ -835,7 +819,7 @@ class FileProcessingDialog(QDialog):
         # Wait for ZIP extraction thread to finish (but don't block UI)
         if hasattr(self, "zip_extraction_thread") and self.zip_extraction_thread:
             # Check if thread is still alive, but don't wait - let cleanup handle it
-            if self.zip_extraction_thread.is_alive():
+            if self.zip_extraction_thread.isRunning():
                 pass  # Let cleanup handle the running thread
 
         # Start threaded cleanup (completely non-blocking)
@@ -852,6 +836,8 @@ class FileProcessingDialog(QDialog):
 
         # Just set the cancellation flag - everything else happens in background
         self.cancel_zip_extraction = True
+        if self.zip_extraction_thread and self.zip_extraction_thread.isRunning():
+            self.zip_extraction_thread.stop()
 
         # Create and start cleanup worker immediately
         self.cleanup_worker = CleanupWorker(
@@ -9,6 +9,7 @@ import hashlib
 import json
 import os
 import platform
+import re
 import shutil
 import sys
 import tempfile
@@ -86,6 +87,9 @@ from workers.ftp_transfer import FTPTransferWorker
 from workers.icon_downloader import IconDownloader
 from workers.zip_extract import ZipExtractorWorker
 
+# Matches a folder name that is an 8 digit hex title ID
+_is_title_id = re.compile(r"[0-9A-Fa-f]{8}").fullmatch
+
 
 class XboxBackupManager(QMainWindow):
     def __init__(self):
@@ -173,6 +177,10 @@ class XboxBackupManager(QMainWindow):
         self._current_transfer_file = ""
         self._current_transfer_speed = ""  # For storing current transfer speed
 
+        # Title update downloads in flight and their progress (0-100), by name;
+        # several run at once, so the progress bar shows their average
+        self._tu_download_progress: Dict[str, int] = {}
+
         # Current processing dialog (to reuse during batch operations)
         self._current_processing_dialog = None
 
@@ -1493,6 +1501,7 @@ class XboxBackupManager(QMainWindow):
                 self.ftp_settings["password"],
                 self.current_target_directory,
                 self.ftp_settings.get("port", 21),
+                buffer_size=self.ftp_settings.get("buffer_size", 256 * 1024),
                 current_platform=self.current_platform,
             )
         else:
@@ -1569,10 +1578,12 @@ class XboxBackupManager(QMainWindow):
             msg_box.setDefaultButton(QMessageBox.StandardButton.No)
 
             if msg_box.exec() == QMessageBox.StandardButton.Yes:
-                # Stop the transfer worker
-                self.transfer_worker.should_stop = True
-                self.transfer_worker.terminate()
-                self.transfer_worker.wait(3000)  # Wait up to 3 seconds
+                # Ask the worker to stop and let it finish its current slice,
+                # so it can clean up a partly written file rather than being
+                # killed mid-write
+                self.status_manager.show_message("Cancelling transfer...")
+                self.transfer_worker.stop()
+                self.transfer_worker.wait()
 
                 # Reset UI state
                 self._on_transfer_cancelled()
@@ -1718,22 +1729,32 @@ class XboxBackupManager(QMainWindow):
 
     def _on_tu_download_started(self, update_name: str):
         """Handle title update download started"""
+        self._tu_download_progress[update_name] = 0
         self.status_manager.show_message(f"Downloading title update: {update_name}")
-        self.progress_bar.setValue(0)
-        self.progress_bar.setVisible(True)
+        self._update_tu_download_progress_bar()
 
     def _on_tu_download_progress(self, update_name: str, progress: int):
         """Handle title update download progress"""
-        self.status_manager.show_message(
-            f"Downloading title update: {update_name} ({progress}%)"
-        )
-        self.progress_bar.setValue(progress)
+        if update_name not in self._tu_download_progress:
+            return
+        self._tu_download_progress[update_name] = progress
+        pending = len(self._tu_download_progress)
+        if pending > 1:
+            self.status_manager.show_message(
+                f"Downloading {pending} title updates ({self._tu_download_percent()}%)"
+            )
+        else:
+            self.status_manager.show_message(
+                f"Downloading title update: {update_name} ({progress}%)"
+            )
+        self._update_tu_download_progress_bar()
 
     def _on_tu_download_complete(
         self, update_name: str, success: bool, filename: str, local_path: str
     ):
         """Handle title update download completion"""
-        self.progress_bar.setVisible(False)
+        self._tu_download_progress.pop(update_name, None)
+        self._update_tu_download_progress_bar()
         if success:
             self.status_manager.show_message(f"Title update installed: {update_name}")
         else:
@@ -1743,7 +1764,8 @@ class XboxBackupManager(QMainWindow):
 
     def _on_tu_download_error(self, update_name: str, error_message: str):
         """Handle title update download error"""
-        self.progress_bar.setVisible(False)
+        self._tu_download_progress.pop(update_name, None)
+        self._update_tu_download_progress_bar()
         self.status_manager.show_message(
             f"Title update download failed: {update_name} - {error_message}"
         )
@@ -1753,6 +1775,21 @@ class XboxBackupManager(QMainWindow):
         )
         self.status_manager.show_message("Transfer failed")
 
+    def _tu_download_percent(self) -> int:
+        """Average progress of the title update downloads in flight"""
+        return sum(self._tu_download_progress.values()) // len(
+            self._tu_download_progress
+        )
+
+    def _update_tu_download_progress_bar(self):
+        """Show the title update downloads' combined progress, hiding the bar
+        once none are pending"""
+        if not self._tu_download_progress:
+            self.progress_bar.setVisible(False)
+            return
+        self.progress_bar.setValue(self._tu_download_percent())
+        self.progress_bar.setVisible(True)
+
     def _check_if_transferred(self, game: GameInfo) -> bool:
         """Check if a game has already been transferred to target directory"""
         if not self.current_target_directory:
@@ -2253,8 +2290,9 @@ class XboxBackupManager(QMainWindow):
         # Load all cached icons
         for cache_file in cache_dir.glob("*.png"):
             title_id = cache_file.stem.upper()
-            pixmap = QPixmap(str(cache_file))
-            if not pixmap.isNull():
+            # Cached icons are PNGs; only fall back to format detection if not
+            pixmap = QPixmap()
+            if pixmap.load(str(cache_file), "PNG") or pixmap.load(str(cache_file)):
                 self.icon_cache[title_id] = pixmap
 
     def save_settings(self):
@@ -3221,44 +3259,42 @@ class XboxBackupManager(QMainWindow):
 
             try:
                 # List all directories in the target directory
-                for item in os.listdir(self.current_target_directory):
-                    item_path = os.path.join(self.current_target_directory, item)
-
-                    # Only process directories
-                    if os.path.isdir(item_path):
-                        folder_name = item
-                        folder_path = item_path
-
-                        # Try to get title ID and game name from the folder
-                        title_id = self._extract_title_id(folder_name, folder_path)
-                        if title_id:
-                            # Check if this is an extracted ISO game
-                            is_extracted_iso = False
-                            if self.current_platform == "xbox360":
-                                xex_path = Path(folder_path) / "default.xex"
-                                is_extracted_iso = xex_path.exists()
-
-                            game_name = self.game_manager.get_game_name(title_id)
-
-                            # If game name is not in loaded games, try to get it from cache
-                            if not game_name:
-                                game_name = self.game_manager.get_game_name_from_cache(
-                                    title_id, self.current_platform
-                                )
-
-                            # If still no name, use Unknown
-                            if not game_name:
-                                game_name = "Unknown"
-
-                            games.append(
-                                {
-                                    "name": game_name,
-                                    "title_id": title_id,
-                                    "folder_path": folder_path,
-                                    "folder_name": folder_name,
-                                    "is_extracted_iso": is_extracted_iso,
-                                }
+                with os.scandir(self.current_target_directory) as entries:
+                    folders = [
+                        (entry.name, entry.path) for entry in entries if entry.is_dir()
+                    ]
+
+                for folder_name, folder_path in folders:
+                    # Try to get title ID and game name from the folder
+                    title_id = self._extract_title_id(folder_name, folder_path)
+                    if title_id:
+                        # Check if this is an extracted ISO game
+                        is_extracted_iso = False
+                        if self.current_platform == "xbox360":
+                            xex_path = Path(folder_path) / "default.xex"
+                            is_extracted_iso = xex_path.exists()
+
+                        game_name = self.game_manager.get_game_name(title_id)
+
+                        # If game name is not in loaded games, try to get it from cache
+                        if not game_name:
+                            game_name = self.game_manager.get_game_name_from_cache(
+                                title_id, self.current_platform
                             )
+
+                        # If still no name, use Unknown
+                        if not game_name:
+                            game_name = "Unknown"
+
+                        games.append(
+                            {
+                                "name": game_name,
+                                "title_id": title_id,
+                                "folder_path": folder_path,
+                                "folder_name": folder_name,
+                                "is_extracted_iso": is_extracted_iso,
+                            }
+                        )
             except Exception as e:
                 print(f"[ERROR] Failed to scan target directory: {e}")
 
@@ -3269,9 +3305,7 @@ class XboxBackupManager(QMainWindow):
         # For XBLA, the folder name is always the title ID
         if self.current_platform == "xbla":
             # Check if folder name looks like a hex title ID (8 characters)
-            if len(folder_name) == 8 and all(
-                c in "0123456789ABCDEFabcdef" for c in folder_name
-            ):
+            if _is_title_id(folder_name):
                 return folder_name.upper()
             return None
 
@@ -3292,9 +3326,7 @@ class XboxBackupManager(QMainWindow):
 
             # For GoD format games, folder name is the title ID
             # Check if folder name looks like a hex title ID (8 characters)
-            if len(folder_name) == 8 and all(
-                c in "0123456789ABCDEFabcdef" for c in folder_name
-            ):
+            if _is_title_id(folder_name):
                 return folder_name.upper()
 
             # If not a GoD format and no XEX found, return None
@@ -3336,9 +3368,7 @@ class XboxBackupManager(QMainWindow):
         # For XBLA, the folder name is always the title ID
         if self.current_platform == "xbla":
             # Check if folder name looks like a hex title ID (8 characters)
-            if len(folder_name) == 8 and all(
-                c in "0123456789ABCDEFabcdef" for c in folder_name
-            ):
+            if _is_title_id(folder_name):
                 return folder_name.upper()
             return None
 
@@ -3381,9 +3411,7 @@ class XboxBackupManager(QMainWindow):
 
             # For GoD format games, folder name is the title ID
             # Check if folder name looks like a hex title ID (8 characters)
-            if len(folder_name) == 8 and all(
-                c in "0123456789ABCDEFabcdef" for c in folder_name
-            ):
+            if _is_title_id(folder_name):
                 return folder_name.upper()
 
             # If not a GoD format and no XEX found, return None
@@ -4322,8 +4350,10 @@ class XboxBackupManager(QMainWindow):
                 + f"/{os.path.basename(extracted_iso_path).replace('.iso', '')}"
             )
 
-            # Store the temp ISO path for cleanup later
-            self.temp_iso_path = extracted_iso_path
+            # Store the temp ISO path for cleanup later; a plain ISO passed
+            # through the extractor is the user's own file, not a temp copy
+            if extracted_iso_path != original_zip:
+                self.temp_iso_path = extracted_iso_path
 
             # Use reuse_dialog for batch operations
             reuse_dialog = hasattr(self, "current_extraction_batch")
@@ -4643,8 +4673,10 @@ class XboxBackupManager(QMainWindow):
     ):
         """Handle batch ZIP extraction completion for GOD creation"""
         if extracted_iso_path and extracted_iso_path.lower().endswith(".iso"):
-            # Store temp ISO for cleanup
-            self.god_temp_isos.append(extracted_iso_path)
+            # Store temp ISO for cleanup, unless it's the user's own ISO
+            # passed straight through the extractor
+            if extracted_iso_path != original_zip:
+                self.god_temp_isos.append(extracted_iso_path)
 
             # Create GOD from extracted ISO - use reuse_dialog for batch operations
             self._create_god_directly(extracted_iso_path, reuse_dialog=True)
@@ -4809,10 +4841,12 @@ class XboxBackupManager(QMainWindow):
 
         # If we got an ISO file, proceed with GOD creation
         if extracted_iso_path and extracted_iso_path.lower().endswith(".iso"):
-            # Store the temp ISO path for cleanup later
+            # Store the temp ISO path for cleanup later, unless it's the
+            # user's own ISO passed straight through the extractor
             if not hasattr(self, "god_temp_isos"):
                 self.god_temp_isos = []
-            self.god_temp_isos.append(extracted_iso_path)
+            if extracted_iso_path != original_zip:
+                self.god_temp_isos.append(extracted_iso_path)
 
             # Create GOD from extracted ISO
             self._create_god_directly(extracted_iso_path)
@@ -5611,14 +5645,11 @@ class XboxBackupManager(QMainWindow):
         if event.mimeData().hasUrls():
 
             def collect_files(path):
-                files = []
+                # Only regular files are returned, so the filter below needs
+                # no further stat calls
                 if os.path.isfile(path):
-                    files.append(path)
-                elif os.path.isdir(path):
-                    for root, _, filenames in os.walk(path):
-                        for fname in filenames:
-                            files.append(os.path.join(root, fname))
-                return files
+                    return [path]
+                return [file for file, _, _ in SystemUtils.iter_files(path)]
 
             all_files = []
             for url in event.mimeData().urls():
@@ -5630,8 +5661,7 @@ class XboxBackupManager(QMainWindow):
             dlc_files = [
                 f
                 for f in all_files
-                if os.path.isfile(f)
-                and len(os.path.basename(f)) == 42
+                if len(os.path.basename(f)) == 42
                 and all(c in "0123456789ABCDEFabcdef" for c in os.path.basename(f))
                 and not os.path.splitext(f)[1]
             ]
@@ -1,7 +1,7 @@
 import locale
 import os
+import posixpath
 from datetime import datetime
-from pathlib import Path
 
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import (
@@ -344,7 +344,7 @@ class XboxUnityTitleUpdatesDialog(QDialog):
             return False
 
         # Create remote directory structure recursively
-        remote_dir = str(Path(remote_path).parent).replace("\\", "/")
+        remote_dir = posixpath.dirname(remote_path)
         success, message = ftp_client.create_directory_recursive(remote_dir)
         if not success:
             print(f"[ERROR] Failed to create FTP directory structure: {message}")
@@ -1,5 +1,6 @@
 import json
 import os
+import posixpath
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -285,7 +286,7 @@ class DLCUtils:
 
         # Check if target file already exists
         files = ftp_client._ftp_list_files_recursive(
-            ftp_client, os.path.dirname(remote_path)
+            ftp_client, posixpath.dirname(remote_path)
         )
         for file_path, fname, file_size in files:
             if fname.upper() == filename.upper() and file_size == os.path.getsize(
@@ -294,7 +295,7 @@ class DLCUtils:
                 return False, "DLC file already exists"
 
         # Create remote directory structure recursively
-        remote_dir = str(Path(remote_path).parent).replace("\\", "/")
+        remote_dir = posixpath.dirname(remote_path)
         success, message = ftp_client.create_directory_recursive(remote_dir)
         if not success:
             print(f"[ERROR] Failed to create FTP directory structure: {message}")
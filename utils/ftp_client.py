@@ -54,6 +54,10 @@ class FTPClient(QObject):
                 # Secure the data connection
                 self._ftp.prot_p()
 
+            # Binary mode for the whole session; SIZE is refused or wrong in
+            # ASCII mode on many servers
+            self._ftp.voidcmd("TYPE I")
+
             self._host = host
             self._username = username
             self._password = password
@@ -176,14 +180,29 @@ class FTPClient(QObject):
             self._ftp.mkd(path)
             return True, "Directory created successfully"
         except ftplib.error_perm as e:
-            # Check if directory already exists
-            if self.directory_exists(path):
+            if self._mkd_error_means_exists(path, e):
                 return True, "Directory already exists"
             else:
                 return False, f"Failed to create directory: {str(e)}"
         except Exception as e:
             return False, f"Failed to create directory: {str(e)}"
 
+    def _mkd_error_means_exists(self, path: str, error: ftplib.error_perm) -> bool:
+        """Decide from an MKD reply whether the directory already exists
+
+        521 is the reply RFC 959 suggests for an existing directory. Most
+        servers send 550 for both "exists" and "denied", so that code is
+        confirmed with a probe. Servers that use some other code, or whose
+        directory can't be probed, are still taken at their word when the
+        reply says the directory exists.
+        """
+        code = str(error)[:3]
+        if code == "521":
+            return True
+        if code == "550" and self.directory_exists(path):
+            return True
+        return "exists" in str(error).lower()
+
     def create_directory_recursive(self, path: str) -> Tuple[bool, str]:
         """Create directory and all parent directories on FTP server"""
         if not self.is_connected():
@@ -214,7 +233,7 @@ class FTPClient(QObject):
                     self._ftp.mkd(current_path)
                 except ftplib.error_perm as e:
                     # If we get an error and it's not because the directory exists
-                    if not self.directory_exists(current_path):
+                    if not self._mkd_error_means_exists(current_path, e):
                         return (
                             False,
                             f"Failed to create directory {current_path}: {str(e)}",
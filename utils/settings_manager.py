@@ -163,6 +163,8 @@ class SettingsManager:
             "port": int(self.settings.value("ftp_port", 21)),
             "username": self.settings.value("ftp_username", ""),
             "password": self.settings.value("ftp_password", ""),
+            # Upload block size; larger blocks mean fewer sends per file
+            "buffer_size": int(self.settings.value("ftp_buffer_size", 256 * 1024)),
         }
 
     def save_xboxunity_settings(self, xboxunity_settings: dict):
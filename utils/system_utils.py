@@ -6,6 +6,7 @@ import subprocess
 import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
+from typing import Iterator, Tuple
 
 from PyQt6.QtWidgets import QApplication, QMessageBox
 from xbe import Xbe
@@ -430,3 +431,36 @@ class SystemUtils:
             logger.error(error_msg)
             QMessageBox.critical(None, "Restart Error", error_msg)
             return False
+
+    @staticmethod
+    def iter_files(root: str, sep: str = os.sep) -> Iterator[Tuple[str, str, int]]:
+        """
+        Walk a directory tree with os.scandir, yielding every regular file
+
+        DirEntry caches the file type and (on Windows) the stat result from the
+        directory read, so this avoids the extra stat calls of os.walk/rglob.
+        Unreadable directories are skipped, matching os.walk.
+
+        Args:
+            root: Directory to walk
+            sep: Separator used to build the relative paths
+
+        Yields:
+            (path, relative_path, size) for each file
+        """
+        stack = [(root, "")]
+        while stack:
+            directory, rel_dir = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        rel_path = (
+                            f"{rel_dir}{sep}{entry.name}" if rel_dir else entry.name
+                        )
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, rel_path))
+                        elif entry.is_file(follow_symlinks=False):
+                            size = entry.stat(follow_symlinks=False).st_size
+                            yield entry.path, rel_path, size
+            except OSError:
+                continue
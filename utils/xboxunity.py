@@ -1,4 +1,4 @@
-import base64
+import functools
 import os
 import re
 import shutil
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from utils.settings_manager import SettingsManager
 from utils.system_utils import SystemUtils
@@ -16,12 +17,26 @@ BASE_URL = "https://xboxunity.net/Api"
 WEB_BASE_URL = "https://xboxunity.net"
 RESOURCES_URL = "https://xboxunity.net/Resources/Lib"
 
-# Reuse a single session to keep connections alive and improve performance
+# Reuse a single session to keep connections alive and improve performance.
+# The pool holds enough connections per host for concurrent title update
+# downloads, and dropped connections are retried instead of failing a batch
 _session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=3)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
 
 # Set default timeout for all requests
 _session.timeout = 30
 
+# Every field get_god_info parses lives in the fixed STFS header or the icon
+# that follows it, so the whole region is read in a single call
+GOD_ICON_OFFSET = 0x171A
+GOD_ICON_MAX_SIZE = 65536
+GOD_HEADER_READ_SIZE = GOD_ICON_OFFSET + GOD_ICON_MAX_SIZE
+
+# Title updates are streamed to disk in chunks this large
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
 
 class XboxUnity:
     """
@@ -335,6 +350,46 @@ class XboxUnity:
             return filename
         return None
 
+    def _resume_validator(self, response_headers) -> Optional[str]:
+        """
+        Get the validator a partial download can be resumed against.
+
+        A strong ETag is preferred; weak ETags can't be used with If-Range, so
+        Last-Modified is used instead when there is no strong one.
+
+        Args:
+            response_headers: Headers of a HEAD or GET response
+
+        Returns:
+            Optional[str]: ETag or Last-Modified value, or None if neither is usable
+        """
+        etag = response_headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            return etag
+        return response_headers.get("last-modified") or None
+
+    def _read_resume_validator(self, partial_destination: str) -> Optional[str]:
+        """Read the validator stored next to a partial download, if any"""
+        try:
+            with open(partial_destination + ".validator", "r", encoding="utf-8") as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def _write_resume_validator(
+        self, partial_destination: str, validator: Optional[str]
+    ):
+        """Store (or, with no validator, drop) a partial download's validator"""
+        validator_path = partial_destination + ".validator"
+        try:
+            if validator:
+                with open(validator_path, "w", encoding="utf-8") as f:
+                    f.write(validator)
+            elif os.path.exists(validator_path):
+                os.remove(validator_path)
+        except OSError as e:
+            print(f"[ERROR] Could not store download validator: {e}")
+
     def download_title_update(
         self,
         url: str,
@@ -358,15 +413,20 @@ class XboxUnity:
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                 "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
                 "Referer": "https://xboxunity.net/",
+                # Content-Length, Range offsets and the .part file all count
+                # raw bytes, which a compressed body wouldn't match
+                "Accept-Encoding": "identity",
             }
 
             # Do a HEAD request first to get the actual filename
+            original_filename = None
+            accepts_ranges = False
+            validator = None
             head_response = _session.head(url, headers=headers, timeout=30)
             if head_response.status_code == 200:
                 content_disposition = head_response.headers.get(
                     "content-disposition", ""
                 )
-                original_filename = None
 
                 if content_disposition:
                     original_filename = self._extract_filename_from_headers(
@@ -383,22 +443,65 @@ class XboxUnity:
                 if os.path.isfile(final_destination):
                     return True, original_filename
 
+                accepts_ranges = (
+                    head_response.headers.get("accept-ranges", "").lower() == "bytes"
+                )
+                validator = self._resume_validator(head_response.headers)
+
             # Create directory if it doesn't exist
             directory = os.path.dirname(destination)
             if directory:
                 os.makedirs(directory, exist_ok=True)
 
-            response = _session.get(url, headers=headers, stream=True, timeout=60)
+            # An earlier interrupted download of the same file is continued
+            # from where it stopped when the server can serve byte ranges and
+            # the file is still the one the part was started from. If-Range
+            # makes the server send the whole file instead if it has changed
+            resume_from = 0
+            request_headers = headers
+            if original_filename and accepts_ranges and validator:
+                partial_destination = (
+                    os.path.join(os.path.dirname(destination), original_filename)
+                    + ".part"
+                )
+                try:
+                    resume_from = os.path.getsize(partial_destination)
+                except OSError:
+                    resume_from = 0
+                if resume_from and (
+                    self._read_resume_validator(partial_destination) == validator
+                ):
+                    request_headers = {
+                        **headers,
+                        "Range": f"bytes={resume_from}-",
+                        "If-Range": validator,
+                    }
+                else:
+                    # No part, or one of an older version of the file
+                    resume_from = 0
+
+            response = _session.get(
+                url, headers=request_headers, stream=True, timeout=60
+            )
+            if response.status_code == 416 and resume_from:
+                # The stored part can't be continued from; start over
+                response.close()
+                os.remove(partial_destination)
+                self._write_resume_validator(partial_destination, None)
+                resume_from = 0
+                response = _session.get(url, headers=headers, stream=True, timeout=60)
 
-            if response.status_code != 200:
+            if response.status_code == 200:
+                # Full body, either requested that way or the range ignored
+                resume_from = 0
+            elif response.status_code != 206 or not resume_from:
                 print(f"[ERROR] Download error: {response.status_code}")
                 print(f"[ERROR] Response: {response.text[:200]}")
                 return False, None
 
             # Get original filename from Content-Disposition header (if we didn't get it from HEAD request)
-            if "original_filename" not in locals() or not original_filename:
+            if not original_filename:
                 content_disposition = response.headers.get("content-disposition", "")
-                original_filename = None
 
                 if content_disposition:
                     original_filename = self._extract_filename_from_headers(
@@ -412,12 +515,24 @@ class XboxUnity:
             # Set final destination with original filename
             destination_dir = os.path.dirname(destination)
             final_destination = os.path.join(destination_dir, original_filename)
+            partial_destination = final_destination + ".part"
 
-            total_size = int(response.headers.get("content-length", 0))
-            downloaded = 0
+            if not resume_from:
+                # Remember which version of the file a new part belongs to
+                self._write_resume_validator(
+                    partial_destination, self._resume_validator(response.headers)
+                )
 
-            with open(final_destination, "wb") as file:
-                for chunk in response.iter_content(chunk_size=8192):
+            total_size = int(response.headers.get("content-length", 0))
+            if total_size:
+                total_size += resume_from
+            downloaded = resume_from
+
+            # The body goes to a .part file that only takes the final name
+            # once complete, so an interrupted download is never mistaken for
+            # a finished one and can be resumed next time
+            with open(partial_destination, "ab" if resume_from else "wb") as file:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if chunk:
                         file.write(chunk)
                         downloaded += len(chunk)
@@ -425,6 +540,14 @@ class XboxUnity:
                         if progress_callback and total_size > 0:
                             progress_callback(downloaded, total_size)
 
+            if total_size and downloaded != total_size:
+                print(
+                    f"[ERROR] Download incomplete: {downloaded} of {total_size} bytes"
+                )
+                return False, None
+
+            os.replace(partial_destination, final_destination)
+            self._write_resume_validator(partial_destination, None)
             return True, original_filename
 
         except requests.exceptions.RequestException:
@@ -649,30 +772,29 @@ class XboxUnity:
         - description: Game description (if available)
         - publisher: Publisher name (if available)
         - title_name: Alternative title name (if available)
+        - icon_data: Raw PNG bytes of the embedded icon (if available)
         """
         try:
             with open(god_header_path, "rb") as f:
+                header = f.read(GOD_HEADER_READ_SIZE)
+
                 # Verify it's an STFS package
-                magic = f.read(4).decode("ascii", errors="ignore").strip()
+                magic = header[:4].decode("ascii", errors="ignore").strip()
                 if magic not in ["CON", "LIVE", "PIRS"]:
                     print(
                         f"Warning: File magic '{magic}' does not match expected STFS types."
                     )
 
                 # Read Title ID (4 bytes at offset 0x360 in STFS header)
-                f.seek(0x360)
-                title_id_bytes = f.read(4)
-                if len(title_id_bytes) == 4:
-                    title_id = struct.unpack(">I", title_id_bytes)[0]
+                if len(header) >= 0x364:
+                    title_id = struct.unpack_from(">I", header, 0x360)[0]
                     title_id = f"{title_id:08X}"
                 else:
                     title_id = None
 
                 # Read Media ID (4 bytes at offset 0x354)
-                f.seek(0x354)
-                media_id_bytes = f.read(4)
-                if len(media_id_bytes) == 4:
-                    media_id = struct.unpack(">I", media_id_bytes)[0]
+                if len(header) >= 0x358:
+                    media_id = struct.unpack_from(">I", header, 0x354)[0]
                     media_id = f"{media_id:08X}"
                 else:
                     media_id = None
@@ -682,8 +804,7 @@ class XboxUnity:
 
                 def try_decode_name(offset):
                     """Try multiple decoding methods for display name"""
-                    f.seek(offset)
-                    name_bytes = f.read(0x80)  # 128 bytes max
+                    name_bytes = header[offset : offset + 0x80]  # 128 bytes max
 
                     results = []
 
@@ -881,8 +1002,7 @@ class XboxUnity:
                 # Try to get publisher name (at offset 0x1711)
                 publisher = None
                 try:
-                    f.seek(0x1711)
-                    publisher_bytes = f.read(0x80)  # 128 bytes max
+                    publisher_bytes = header[0x1711 : 0x1711 + 0x80]  # 128 bytes max
                     publisher = publisher_bytes.decode("utf-16le", errors="ignore")
                     publisher = publisher.replace("\x00", "").strip()
                     if not publisher:
@@ -893,8 +1013,7 @@ class XboxUnity:
                 # Try to get description (at offset 0x1791)
                 description = None
                 try:
-                    f.seek(0x1791)
-                    desc_bytes = f.read(0x100)  # 256 bytes max
+                    desc_bytes = header[0x1791 : 0x1791 + 0x100]  # 256 bytes max
                     description = desc_bytes.decode("utf-16le", errors="ignore")
                     description = description.replace("\x00", "").strip()
                     if not description:
@@ -903,27 +1022,21 @@ class XboxUnity:
                     description = None
 
                 # Extract icon data (PNG format, typically at offset 0x171A)
-                icon_base64 = None
+                icon_png = None
                 try:
-                    f.seek(0x171A)
-                    # Read potential PNG header to check if icon exists
-                    png_signature = f.read(8)
+                    # Check the PNG header to see if an icon exists
+                    png_signature = header[GOD_ICON_OFFSET : GOD_ICON_OFFSET + 8]
                     if png_signature == b"\x89PNG\r\n\x1a\n":
-                        # Found PNG signature, read the icon
-                        f.seek(0x171A)
-                        # Read up to 64KB for the icon (should be plenty)
-                        icon_data = f.read(65536)
+                        # Found PNG signature, the icon is up to 64KB (should be plenty)
+                        icon_data = header[GOD_ICON_OFFSET:]
 
                         # Find the end of the PNG file (IEND chunk)
                         iend_pos = icon_data.find(b"IEND")
                         if iend_pos != -1:
                             # Include the IEND chunk and CRC (8 bytes total)
-                            icon_data = icon_data[: iend_pos + 8]
-
-                            # Convert to base64 for consistent handling
-                            icon_base64 = base64.b64encode(icon_data).decode("ascii")
+                            icon_png = icon_data[: iend_pos + 8]
                 except Exception:
-                    icon_base64 = None
+                    icon_png = None
 
                 return {
                     "title_id": title_id,
@@ -931,7 +1044,7 @@ class XboxUnity:
                     "display_name": display_name,
                     "publisher": publisher,
                     "description": description,
-                    "icon_base64": icon_base64,
+                    "icon_data": icon_png,
                 }
 
         except FileNotFoundError:
@@ -940,3 +1053,13 @@ class XboxUnity:
         except Exception as e:
             print(f"Error reading GoD file: {e}")
             return None
+
+
+@functools.lru_cache(maxsize=2048)
+def cached_god_info(path: str, mtime_ns: int, size: int) -> Optional[Dict]:
+    """Parse a GoD/XBLA header, memoized by path, mtime and size
+
+    Headers never change once written, so a re-scan of an unchanged library,
+    and the icon pass that follows it, skip the parse entirely.
+    """
+    return XboxUnity().get_god_info(path)
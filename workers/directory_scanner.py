@@ -1,5 +1,10 @@
 import base64
+import functools
+import hashlib
 import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -7,24 +12,23 @@ from PyQt6.QtCore import QThread, pyqtSignal
 
 from models.game_info import GameInfo
 from utils.system_utils import SystemUtils
-from utils.xboxunity import XboxUnity
+from utils.xboxunity import cached_god_info
 from utils.dlc_utils import DLCUtils
 
 
+@functools.lru_cache(maxsize=2048)
+def _cached_file_hash(path: str, mtime_ns: int, size: int) -> str:
+    """SHA1 of a file, memoized by path, mtime and size"""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha1").hexdigest()
+
+
 class DirectoryScanner(QThread):
     def _compute_file_hash(self, file_path: str) -> Optional[str]:
         """Compute SHA1 hash of a file"""
-        import hashlib
-
         try:
-            sha1 = hashlib.sha1()
-            with open(file_path, "rb") as f:
-                while True:
-                    data = f.read(65536)
-                    if not data:
-                        break
-                    sha1.update(data)
-            return sha1.hexdigest()
+            st = os.stat(file_path)
+            return _cached_file_hash(file_path, st.st_mtime_ns, st.st_size)
         except Exception as e:
             print(f"Error computing hash for {file_path}: {e}")
             return None
@@ -73,6 +77,13 @@ class DirectoryScanner(QThread):
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
+    # Minimum interval between progress emissions (~60Hz)
+    PROGRESS_INTERVAL_NS = 16_000_000
+
+    # Number of game folders inspected concurrently; sizing is stat-bound and
+    # stops scaling beyond a handful of threads on most drives
+    MAX_SCAN_WORKERS = 4
+
     def __init__(
         self,
         directory: str,
@@ -84,9 +95,11 @@ class DirectoryScanner(QThread):
         self.directory = directory
         self.platform = platform
         self.should_stop = False
-        self.xbox_unity = XboxUnity()
-        self.dlc_utils = DLCUtils(parent)
+        self.dlc_utils = DLCUtils(parent) if parent is not None else None
         self.cache_data = cache_data or {}
+        # DLCs per title ID, read once per scan by _process_folders
+        self._dlc_counts: Counter = Counter()
+        self._last_progress_ns = 0
         self._build_cache_lookup()
 
     def run(self):
@@ -110,32 +123,22 @@ class DirectoryScanner(QThread):
         folders = []
 
         # Get all subdirectories
-        for item in os.listdir(self.directory):
-            if self.should_stop:
-                return
-            item_path = os.path.join(self.directory, item)
-            if os.path.isdir(item_path):
-                folders.append(item_path)
-
-        total_folders = len(folders)
-        self.progress.emit(0, total_folders)
-
-        for i, folder_path in enumerate(folders):
-            if self.should_stop:
-                return
-
-            # Look for default.xbe file
-            xbe_path = os.path.join(folder_path, "default.xbe")
-            if os.path.exists(xbe_path):
-                game_info = self._process_xbox_game(folder_path, xbe_path)
-                if game_info and not self.should_stop:
-                    self.game_found.emit(game_info)
-
-            if not self.should_stop:
-                self.progress.emit(i + 1, total_folders)
-
-        if not self.should_stop:
-            self.finished.emit()
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if self.should_stop:
+                    return
+                if entry.is_dir():
+                    folders.append(entry.path)
+
+        self._process_folders(folders, self._process_xbox_folder)
+
+    def _process_xbox_folder(self, folder_path: str) -> Optional[GameInfo]:
+        """Process a folder if it contains an original Xbox game"""
+        # Look for default.xbe file
+        xbe_path = os.path.join(folder_path, "default.xbe")
+        if os.path.exists(xbe_path):
+            return self._process_xbox_game(folder_path, xbe_path)
+        return None
 
     def _process_xbox_game(self, folder_path: str, xbe_path: str) -> Optional[GameInfo]:
         """Process an Xbox game folder"""
@@ -224,7 +227,7 @@ class DirectoryScanner(QThread):
                 name = f"Unknown Game ({title_id})"
 
             size_bytes = self._calculate_directory_size(folder_path)
-            dlc_count = self.dlc_utils.get_dlc_count(title_id)
+            dlc_count = self._get_dlc_count(title_id)
 
             game_info = GameInfo(
                 title_id=title_id,
@@ -251,8 +254,9 @@ class DirectoryScanner(QThread):
         """Process an Xbox 360 GoD game folder"""
         try:
             # Try to extract detailed info from GoD header
-            god_header_path = Path(folder_path) / "00007000"
-            header_files = list(god_header_path.glob("*"))
+            god_header_dir = os.path.join(folder_path, "00007000")
+            with os.scandir(god_header_dir) as it:
+                header_files = [entry.path for entry in it if entry.is_file()]
 
             god_info = None
             media_id = None
@@ -261,7 +265,7 @@ class DirectoryScanner(QThread):
             file_hash = None
             if header_files:
                 # Use the first header file found
-                header_file_path = str(header_files[0])
+                header_file_path = header_files[0]
                 file_hash = self._compute_file_hash(header_file_path)
 
                 # Check cache first
@@ -271,7 +275,7 @@ class DirectoryScanner(QThread):
                     return cached_game
 
                 # Extract comprehensive GoD information
-                god_info = self.xbox_unity.get_god_info(header_file_path)
+                god_info = self._get_god_info(header_file_path)
 
                 if god_info:
                     if god_info.get("title_id") and god_info["title_id"] != "00000000":
@@ -279,8 +283,8 @@ class DirectoryScanner(QThread):
                     media_id = god_info.get("media_id")
                     if god_info.get("display_name"):
                         game_name = god_info["display_name"]
-                    if god_info.get("icon_base64"):
-                        self._cache_god_icon(title_id, god_info["icon_base64"])
+                    if god_info.get("icon_data"):
+                        self._cache_god_icon(title_id, god_info["icon_data"])
 
             # Get title name - prioritize GoD extracted name, then fallback to title ID
             if game_name:
@@ -293,7 +297,7 @@ class DirectoryScanner(QThread):
             size_bytes = self._calculate_directory_size(folder_path)
 
             # Get DLC count
-            dlc_count = self.dlc_utils.get_dlc_count(title_id)
+            dlc_count = self._get_dlc_count(title_id)
 
             # Create GameInfo object
             game_info = GameInfo(
@@ -328,7 +332,9 @@ class DirectoryScanner(QThread):
                 print(f"Using cached data for: {cached_game.name}")
                 return cached_game
 
-            god_info = self.xbox_unity.get_god_info(header_file_path)
+            god_info = self._get_god_info(header_file_path)
+            media_id = None
+            game_name = None
 
             if god_info:
                 if god_info.get("title_id") and god_info["title_id"] != "00000000":
@@ -336,9 +342,10 @@ class DirectoryScanner(QThread):
                 media_id = god_info.get("media_id")
                 if god_info.get("display_name"):
                     game_name = god_info["display_name"]
-                if god_info.get("icon_base64"):
-                    self._cache_god_icon(title_id, god_info["icon_base64"])
-                dlc_count = self.dlc_utils.get_dlc_count(title_id)
+                if god_info.get("icon_data"):
+                    self._cache_god_icon(title_id, god_info["icon_data"])
+
+            dlc_count = self._get_dlc_count(title_id)
 
             if game_name:
                 name = game_name
@@ -365,77 +372,106 @@ class DirectoryScanner(QThread):
             print(f"Error processing XBLA game {folder_path}: {e}")
             return None
 
+    def _get_dlc_count(self, title_id: str) -> int:
+        """Get the DLC count for a title, or 0 when DLC support is unavailable"""
+        return self._dlc_counts[title_id]
+
+    def _get_god_info(self, header_file_path: str) -> Optional[Dict]:
+        """Get GoD header info, reusing the result for unchanged files"""
+        st = os.stat(header_file_path)
+        return cached_god_info(header_file_path, st.st_mtime_ns, st.st_size)
+
     def _scan_xbox360_directory(self):
         """Scan directory for Xbox 360/XBLA games (GoD format), XBLA games, and extracted ISO games"""
         folders = []
 
         # Get all subdirectories
-        for item in os.listdir(self.directory):
+        with os.scandir(self.directory) as entries:
+            subdirs = [(entry.name, entry.path) for entry in entries if entry.is_dir()]
+
+        for item, item_path in subdirs:
             if self.should_stop:
                 return
-            item_path = os.path.join(self.directory, item)
-            if os.path.isdir(item_path):
-                # Check if it's an extracted ISO game (has default.xex)
-                xex_path = os.path.join(item_path, "default.xex")
-                if os.path.exists(xex_path):
-                    folders.append((item_path, None, "iso", xex_path))
-                else:
-                    # Check if it's an XBLA game (has 000D0000 subfolder)
-                    xbla_folder = os.path.join(item_path, "000D0000")
-                    if os.path.isdir(xbla_folder):
-                        # There's only one file in the 000D0000 folder, get its path
-                        xbla_files = [
-                            f
-                            for f in os.listdir(xbla_folder)
-                            if os.path.isfile(os.path.join(xbla_folder, f))
-                        ]
-                        if xbla_files:
-                            xbla_exe = os.path.join(xbla_folder, xbla_files[0])
-                            folders.append((item_path, item.upper(), "xbla", xbla_exe))
-                    else:
-                        # GoD format if it has 00007000 subfolder
-                        god_folder = os.path.join(item_path, "00007000")
-                        if os.path.isdir(god_folder):
-                            folders.append((item_path, item.upper(), "god"))
-                        else:
-                            # Unknown format, skip
-                            continue
-
+            # Check if it's an extracted ISO game (has default.xex)
+            xex_path = os.path.join(item_path, "default.xex")
+            if os.path.exists(xex_path):
+                folders.append((item_path, None, "iso", xex_path))
+                continue
+
+            # Check if it's an XBLA game (has 000D0000 subfolder)
+            xbla_folder = os.path.join(item_path, "000D0000")
+            if os.path.isdir(xbla_folder):
+                # There's only one file in the 000D0000 folder, get its path
+                with os.scandir(xbla_folder) as xbla_entries:
+                    xbla_exe = next(
+                        (entry.path for entry in xbla_entries if entry.is_file()),
+                        None,
+                    )
+                if xbla_exe:
+                    folders.append((item_path, item.upper(), "xbla", xbla_exe))
+            elif os.path.isdir(os.path.join(item_path, "00007000")):
+                # GoD format if it has 00007000 subfolder
+                folders.append((item_path, item.upper(), "god"))
+
+        self._process_folders(folders, self._process_xbox360_folder)
+
+    def _process_xbox360_folder(self, folder_info: tuple) -> Optional[GameInfo]:
+        """Process a classified Xbox 360 folder according to its game type"""
+        if len(folder_info) == 3:  # GoD format
+            folder_path, title_id, game_type = folder_info
+            return self._process_god_game(folder_path, title_id)
+        elif folder_info[2] == "xbla":  # XBLA format
+            folder_path, title_id, game_type, xbla_exe = folder_info
+            return self._process_xbla_game(folder_path, title_id, xbla_exe)
+        else:  # Extracted ISO format
+            folder_path, _, game_type, xex_path = folder_info
+            return self._process_extracted_iso_game(folder_path, xex_path)
+
+    def _process_folders(self, folders: list, process_folder):
+        """Process folders on a thread pool, emitting games in folder order
+
+        Folder inspection is a few stat/read calls per game, so running them
+        concurrently overlaps the directory reads while results are still
+        reported in the same order as the directory listing.
+        """
         total_folders = len(folders)
         self.progress.emit(0, total_folders)
 
-        for i, folder_info in enumerate(folders):
-            if self.should_stop:
-                return
+        # The DLC index is read (and pruned, which rewrites the file) here on
+        # the scanner thread; the pool threads only look counts up
+        if self.dlc_utils:
+            self._dlc_counts = Counter(
+                entry["title_id"] for entry in self.dlc_utils.load_dlc_index()
+            )
 
-            if len(folder_info) == 3:  # GoD format
-                folder_path, title_id, game_type = folder_info
-                game_info = self._process_god_game(folder_path, title_id)
-            elif folder_info[2] == "xbla":  # XBLA format
-                folder_path, title_id, game_type, xbla_exe = folder_info
-                game_info = self._process_xbla_game(folder_path, title_id, xbla_exe)
-            else:  # Extracted ISO format
-                folder_path, _, game_type, xex_path = folder_info
-                game_info = self._process_extracted_iso_game(folder_path, xex_path)
+        with ThreadPoolExecutor(max_workers=self.MAX_SCAN_WORKERS) as executor:
+            futures = [executor.submit(process_folder, folder) for folder in folders]
 
-            if game_info and not self.should_stop:
-                self.game_found.emit(game_info)
+            for i, future in enumerate(futures):
+                if self.should_stop:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    return
 
-            if not self.should_stop:
-                self.progress.emit(i + 1, total_folders)
+                game_info = future.result()
+                if game_info and not self.should_stop:
+                    self.game_found.emit(game_info)
+
+                if not self.should_stop:
+                    self._emit_progress(i + 1, total_folders)
 
         if not self.should_stop:
             self.finished.emit()
 
-    def _calculate_directory_size(self, directory: Path) -> int:
+    def _emit_progress(self, current: int, total: int):
+        """Emit progress at most every PROGRESS_INTERVAL_NS, always on the last item"""
+        now = time.monotonic_ns()
+        if now - self._last_progress_ns > self.PROGRESS_INTERVAL_NS or current == total:
+            self.progress.emit(current, total)
+            self._last_progress_ns = now
+
+    def _calculate_directory_size(self, directory: str) -> int:
         """Calculate total size of directory in bytes"""
-        total_size = 0
-        for dirpath, _, filenames in os.walk(directory):
-            for filename in filenames:
-                file_path = Path(dirpath) / filename
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
-        return total_size
+        return sum(size for _, _, size in SystemUtils.iter_files(directory))
 
     def _format_size(self, size_bytes: int) -> str:
         """Format size in bytes to a human-readable string"""
@@ -462,15 +498,14 @@ class DirectoryScanner(QThread):
         except Exception as e:
             print(f"Failed to cache icon for {title_id}: {e}")
 
-    def _cache_god_icon(self, title_id: str, icon_base64: str):
+    def _cache_god_icon(self, title_id: str, icon_data: bytes):
         """Cache the extracted GoD icon to the cache/icons directory"""
         try:
             # Create cache/icons directory if it doesn't exist
             cache_icons_dir = Path("cache") / "icons"
             cache_icons_dir.mkdir(parents=True, exist_ok=True)
 
-            # Decode base64 and save as PNG file
-            icon_data = base64.b64decode(icon_base64)
+            # The header already holds the icon as PNG, save it unchanged
             icon_path = cache_icons_dir / f"{title_id}.png"
 
             with open(icon_path, "wb") as f:
@@ -1,10 +1,26 @@
-from pathlib import Path
+import os
+import shutil
+import sys
+import threading
+import time
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from utils.system_utils import SystemUtils
 from utils.ui_utils import UIUtils
 
 
+# Files are handed to the kernel in slices of this size so progress can still
+# be reported between calls
+SENDFILE_CHUNK_SIZE = 8 * 1024 * 1024
+MIN_BUFFER_SIZE = 1024 * 1024
+# Files above this size are copied in slices so progress can be reported
+# mid-file; smaller ones go straight through shutil.copyfile
+PROGRESS_MIN_SIZE = 50 * 1024 * 1024
+# Files above this size get page cache hints where the platform supports them
+FADVISE_MIN_SIZE = 64 * 1024 * 1024
+
+
 class FileTransferWorker(QThread):
     progress = pyqtSignal(int, int, str)  # current_game, total_games, game_name
     file_progress = pyqtSignal(str, int)  # game_name, percentage
@@ -12,6 +28,9 @@ class FileTransferWorker(QThread):
     transfer_complete = pyqtSignal()
     transfer_error = pyqtSignal(str)
 
+    # Minimum interval in seconds between file_progress emissions (~20Hz)
+    PROGRESS_INTERVAL = 0.05
+
     def __init__(
         self,
         games_to_transfer,
@@ -24,51 +43,58 @@ class FileTransferWorker(QThread):
         self.games_to_transfer = games_to_transfer
         self.target_directory = target_directory
         self.max_workers = max_workers
-        self.buffer_size = buffer_size
+        self.buffer_size = max(buffer_size, MIN_BUFFER_SIZE)
         self.current_game_index = 0
         self.current_platform = current_platform
+        self._last_progress_percent = -1
+        self._last_progress_time = 0.0
+        self._copy_buffer = None
+        self._stop_event = threading.Event()
 
     def run(self):
         try:
             total_games = len(self.games_to_transfer)
 
             for i, game in enumerate(self.games_to_transfer):
+                if self._stop_event.is_set():
+                    break
+
                 self.current_game_index = i
                 self.progress.emit(i, total_games, game.name)
 
                 # Transfer the game with per-file progress
                 self._transfer_game_with_progress(game)
 
+                if self._stop_event.is_set():
+                    break
+
                 self.game_transferred.emit(game.title_id)
 
-            self.transfer_complete.emit()
+            if not self._stop_event.is_set():
+                self.transfer_complete.emit()
 
         except Exception as e:
             self.transfer_error.emit(str(e))
 
     def _transfer_game_with_progress(self, game):
         """Transfer a single game with file-level progress tracking"""
-        source_path = Path(game.folder_path)
+        self._last_progress_percent = -1
+
+        source_path = game.folder_path
 
         # Use UIUtils to build target path consistently
-        target_path = Path(
-            UIUtils.build_target_path(
-                self.target_directory,
-                self.current_platform,
-                game.name,
-                game.title_id,
-                game.is_extracted_iso,
-            )
+        target_path = UIUtils.build_target_path(
+            self.target_directory,
+            self.current_platform,
+            game.name,
+            game.title_id,
+            game.is_extracted_iso,
         )
 
-        # Calculate total size and file count for this game
-        total_files = 0
-        total_size = 0
-
-        for file_path in source_path.rglob("*"):
-            if file_path.is_file():
-                total_files += 1
-                total_size += file_path.stat().st_size
+        # Enumerate files once; the copy loop below reuses the paths and sizes
+        source_files = list(SystemUtils.iter_files(source_path))
+        total_files = len(source_files)
+        total_size = sum(size for _, _, size in source_files)
 
         if total_files == 0:
             return
@@ -77,21 +103,31 @@ class FileTransferWorker(QThread):
         copied_size = 0
         copied_files = 0
 
-        target_path.mkdir(parents=True, exist_ok=True)
+        # Sizes of files already on the target, so resumed transfers can skip
+        # them without touching the filesystem again
+        existing = {
+            rel_path: size for _, rel_path, size in SystemUtils.iter_files(target_path)
+        }
+
+        os.makedirs(target_path, exist_ok=True)
+        created_dirs = {target_path}
+
+        for source_file, rel_path, file_size in source_files:
+            if self._stop_event.is_set():
+                return
 
-        for file_path in source_path.rglob("*"):
-            if file_path.is_file():
-                # Calculate relative path for target
-                rel_path = file_path.relative_to(source_path)
-                target_file = target_path / rel_path
+            if existing.get(rel_path) != file_size:
+                target_file = os.path.join(target_path, rel_path)
 
-                # Create parent directories if needed
-                target_file.parent.mkdir(parents=True, exist_ok=True)
+                # Create parent directories once per unique directory
+                target_dir = os.path.dirname(target_file)
+                if target_dir not in created_dirs:
+                    os.makedirs(target_dir, exist_ok=True)
+                    created_dirs.add(target_dir)
 
                 # Copy file with buffered reading for large files
-                file_size = file_path.stat().st_size
                 self._copy_file_with_progress(
-                    file_path,
+                    source_file,
                     target_file,
                     file_size,
                     game.name,
@@ -99,42 +135,129 @@ class FileTransferWorker(QThread):
                     total_size,
                 )
 
-                copied_size += file_size
-                copied_files += 1
+            copied_size += file_size
+            copied_files += 1
 
-                # Emit progress based on total size copied
-                if total_size > 0:
-                    progress_percent = int((copied_size / total_size) * 100)
-                    self.file_progress.emit(game.name, progress_percent)
+            # Emit progress based on total size copied
+            if total_size > 0:
+                progress_percent = int((copied_size / total_size) * 100)
+                self._emit_file_progress(game.name, progress_percent)
 
     def _copy_file_with_progress(
         self, source_file, target_file, file_size, game_name, current_copied, total_size
     ):
         """Copy a single file with progress updates"""
         try:
-            # Check if file already exists and has the same size
-            if target_file.exists():
-                existing_size = target_file.stat().st_size
-
-                if existing_size == file_size:
-                    return
-
-            with open(source_file, "rb") as src, open(target_file, "wb") as dst:
-                copied = 0
-                while True:
-                    chunk = src.read(self.buffer_size)
-                    if not chunk:
-                        break
-
-                    dst.write(chunk)
-                    copied += len(chunk)
-
-                    # Update progress for large files
-                    if file_size > 50 * 1024 * 1024:  # Only for files > 50MB
-                        overall_copied = current_copied + copied
-                        if total_size > 0:
-                            progress_percent = int((overall_copied / total_size) * 100)
-                            self.file_progress.emit(game_name, progress_percent)
+            if file_size <= PROGRESS_MIN_SIZE:
+                shutil.copyfile(source_file, target_file)
+            else:
+                self._copy_large_file(
+                    source_file,
+                    target_file,
+                    file_size,
+                    game_name,
+                    current_copied,
+                    total_size,
+                )
 
         except Exception as e:
             raise Exception(f"Failed to copy {source_file}: {str(e)}")
+
+    def _copy_large_file(
+        self, source_file, target_file, file_size, game_name, current_copied, total_size
+    ):
+        """Copy a large file in slices, reporting progress between slices"""
+        cancelled = False
+        with open(source_file, "rb") as src, open(target_file, "wb") as dst:
+            fadvise = file_size > FADVISE_MIN_SIZE and hasattr(os, "posix_fadvise")
+            if fadvise:
+                os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            if sys.platform.startswith("linux"):
+                chunks = self._sendfile_chunks(src, dst, file_size)
+            else:
+                chunks = self._buffered_chunks(src, dst)
+
+            copied = 0
+            for sent in chunks:
+                # Checked once per slice, so cancelling takes effect mid-file
+                if self._stop_event.is_set():
+                    cancelled = True
+                    break
+
+                copied += sent
+
+                # Update progress for large files
+                if total_size > 0:
+                    overall_copied = current_copied + copied
+                    progress_percent = int((overall_copied / total_size) * 100)
+                    self._emit_file_progress(game_name, progress_percent)
+
+            # Drop the copied pages so one large game does not evict the
+            # cache for the rest of the transfer
+            if fadvise:
+                dst.flush()
+                os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                os.posix_fadvise(dst.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+        # Don't leave a truncated file behind on the target
+        if cancelled:
+            os.remove(target_file)
+
+    def _sendfile_chunks(self, src, dst, file_size):
+        """Copy in-kernel with os.sendfile, yielding the bytes sent per call"""
+        in_fd = src.fileno()
+        out_fd = dst.fileno()
+        offset = 0
+        try:
+            while offset < file_size:
+                sent = os.sendfile(
+                    out_fd, in_fd, offset, min(file_size - offset, SENDFILE_CHUNK_SIZE)
+                )
+                if sent == 0:
+                    # End of file before the size it was listed with
+                    break
+                offset += sent
+                yield sent
+        except OSError:
+            # Some filesystems reject sendfile; continue with buffered copy
+            if offset == 0:
+                yield from self._buffered_chunks(src, dst)
+                return
+            raise
+
+        if offset != file_size:
+            raise Exception(
+                f"File changed size during copy ({offset} of {file_size} bytes)"
+            )
+
+    def _buffered_chunks(self, src, dst):
+        """Copy through a user-space buffer, yielding the bytes written per read"""
+        # One buffer is reused for every file so the loop does not allocate
+        if self._copy_buffer is None:
+            self._copy_buffer = bytearray(self.buffer_size)
+        buffer = self._copy_buffer
+        view = memoryview(buffer)
+
+        while True:
+            read = src.readinto(buffer)
+            if not read:
+                break
+
+            dst.write(view[:read])
+            yield read
+
+    def stop(self):
+        """Ask the transfer to stop after the current slice of the current file"""
+        self._stop_event.set()
+
+    def _emit_file_progress(self, game_name, percent):
+        """Emit file_progress on a percentage change, at most every PROGRESS_INTERVAL"""
+        if percent == self._last_progress_percent:
+            return
+
+        now = time.monotonic()
+        if percent >= 100 or now - self._last_progress_time >= self.PROGRESS_INTERVAL:
+            self.file_progress.emit(game_name, percent)
+            self._last_progress_percent = percent
+            self._last_progress_time = now
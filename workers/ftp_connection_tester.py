@@ -17,36 +17,34 @@ class FTPConnectionTester(QThread):
 
     def run(self):
         """Test FTP connection in background thread"""
+        ftp = ftplib.FTP()
         try:
-            # Quick TCP connection test first
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
-
-            result = sock.connect_ex((self.host, self.port))
-            sock.close()
-
-            if result == 0:
-                # TCP connection succeeded, try FTP greeting
-                try:
-                    ftp = ftplib.FTP()
-                    ftp.connect(self.host, self.port, timeout=self.timeout)
-                    ftp.getwelcome()
-                    ftp.quit()
-                    self.connection_result.emit(True, "FTP server reachable")
-                except Exception as e:
-                    self.connection_result.emit(
-                        False, f"FTP server not responding: {str(e)}"
-                    )
-            else:
-                self.connection_result.emit(
-                    False, f"Cannot connect to {self.host}:{self.port}"
-                )
-
+            # A single connection: connect() reads the server greeting on the
+            # same socket, so no separate TCP probe is needed
+            ftp.connect(self.host, self.port, timeout=self.timeout)
         except socket.timeout:
             self.connection_result.emit(
                 False, f"Connection to {self.host}:{self.port} timed out"
             )
+            return
         except socket.gaierror:
             self.connection_result.emit(False, f"Cannot resolve hostname: {self.host}")
+            return
+        except (ftplib.Error, EOFError) as e:
+            self.connection_result.emit(False, f"FTP server not responding: {str(e)}")
+            return
+        except OSError:
+            self.connection_result.emit(
+                False, f"Cannot connect to {self.host}:{self.port}"
+            )
+            return
         except Exception as e:
             self.connection_result.emit(False, f"Connection error: {str(e)}")
+            return
+
+        try:
+            ftp.quit()
+        except Exception:
+            ftp.close()
+
+        self.connection_result.emit(True, "FTP server reachable")
@@ -1,12 +1,41 @@
+import ftplib
+import functools
 import os
+import posixpath
+import queue
+import ssl
+import threading
 import time
-from pathlib import Path
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from utils.ftp_client import FTPClient
+from utils.system_utils import SystemUtils
 from utils.ui_utils import UIUtils
 
+# Files above this size get page cache hints where the platform supports them
+FADVISE_MIN_SIZE = 64 * 1024 * 1024
+
+# Seconds to wait for an XCRC reply. The console reads the whole file before
+# answering, which for a multi-GB file takes minutes, far beyond the control
+# connection's usual timeout
+XCRC_TIMEOUT = 15 * 60
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_file_crc32(path: str, mtime_ns: int, size: int) -> int:
+    """CRC32 of a file, memoized by path, mtime and size"""
+    crc = 0
+    buffer = bytearray(1024 * 1024)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while n := f.readinto(buffer):
+            crc = zlib.crc32(view[:n], crc)
+    return crc
+
 
 class FTPTransferWorker(QThread):
     progress = pyqtSignal(int, int, str)  # current_game, total_games, game_name
@@ -17,6 +46,9 @@ class FTPTransferWorker(QThread):
     transfer_complete = pyqtSignal()
     transfer_error = pyqtSignal(str)
 
+    # Minimum interval in seconds between file_progress emissions (~20Hz)
+    PROGRESS_INTERVAL = 0.05
+
     def __init__(
         self,
         games_to_transfer,
@@ -25,8 +57,9 @@ class FTPTransferWorker(QThread):
         ftp_password,
         ftp_target_path,
         ftp_port=21,
-        buffer_size=8192,
+        buffer_size=256 * 1024,
         current_platform=None,
+        max_connections=4,
     ):
         super().__init__()
         self.games_to_transfer = games_to_transfer
@@ -39,6 +72,30 @@ class FTPTransferWorker(QThread):
         self.current_game_index = 0
         self.should_stop = False
         self.current_platform = current_platform
+        self._last_progress_percent = -1
+        self._last_progress_time = 0.0
+        self._last_file_time = 0.0
+        self._remote_sizes: Optional[Dict[str, int]] = None
+        # Sizes of remote files seen in listings or uploaded during this run
+        self._remote_files: Dict[str, int] = {}
+        self._mlsd_supported = True
+        self._mlst_supported = True
+        # Whether the server advertises XCRC; probed with FEAT on connect
+        self._xcrc_supported = False
+        # Number of FTP sessions used to upload a game's files concurrently
+        self.max_connections = max(1, max_connections)
+        self._upload_clients: List[FTPClient] = []
+        self._client_dirs: Dict[FTPClient, str] = {}
+        # Local path of each session's last STOR whose reply is unread
+        self._pending_stores: Dict[FTPClient, str] = {}
+        # Remote directories known to exist, shared by every game in the run
+        self._created_dirs = set()
+        # Subdirectories of each directory whose full contents are known
+        # (listed or just created). These are never listed again, and a child
+        # missing from them needs no existence probe
+        self._listed_dirs: Dict[str, set] = {}
+        self._progress_lock = threading.Lock()
+        self._uploaded_size = 0
 
     def run(self):
         ftp_client = FTPClient()
@@ -53,6 +110,8 @@ class FTPTransferWorker(QThread):
                 self.transfer_error.emit(f"FTP Connection failed: {message}")
                 return
 
+            self._xcrc_supported = self._server_supports(ftp_client, "XCRC")
+
             total_games = len(self.games_to_transfer)
 
             for i, game in enumerate(self.games_to_transfer):
@@ -74,14 +133,19 @@ class FTPTransferWorker(QThread):
             self.transfer_error.emit(str(e))
         finally:
             ftp_client.disconnect()
+            for client in self._upload_clients[1:]:
+                client.disconnect()
+            self._upload_clients = []
+            self._client_dirs = {}
+            self._pending_stores = {}
 
     def _transfer_game_via_ftp(self, ftp_client: FTPClient, game):
         """Transfer a single game via FTP"""
-        source_path = Path(game.folder_path)
+        self._last_progress_percent = -1
 
         # Initialize timing variables for speed tracking
-        self._transfer_start_time = time.time()
-        self._last_speed_update = time.time()
+        self._transfer_start_time = time.monotonic()
+        self._last_speed_update = self._transfer_start_time
 
         # Create target directory on FTP server using consolidated logic
         target_ftp_path = UIUtils.build_target_path(
@@ -92,118 +156,353 @@ class FTPTransferWorker(QThread):
             game.is_extracted_iso,
         )
 
-        success, message = ftp_client.create_directory(target_ftp_path)
-        if not success:
-            raise Exception(
-                f"Failed to create game directory {target_ftp_path}: {message}"
+        # Walk the local folder while the control connection is busy with
+        # the remote round-trips below
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            local_scan = executor.submit(
+                self._list_local_files, game.folder_path, target_ftp_path
             )
 
+            self._ensure_dir(ftp_client, target_ftp_path)
+
+            # List what is already on the server in one pass so existence
+            # checks don't cost a round-trip per file
+            self._remote_sizes = self._ftp_walk_sizes(ftp_client, target_ftp_path)
+
+            local_files = local_scan.result()
+
+        # Check which files already exist on the FTP server. Without a remote
+        # listing, or with XCRC to confirm matches, this is a round-trip per
+        # file, so those probes are spread across the upload sessions too
+        if self._remote_sizes is None or self._xcrc_supported:
+            exists = self._run_on_sessions(
+                ftp_client, self._check_ftp_file_exists, local_files
+            )
+        else:
+            exists = [
+                self._check_ftp_file_exists(ftp_client, *local_file)
+                for local_file in local_files
+            ]
+
         # Calculate total size for progress (only for files that need to be transferred)
         total_size = 0
         files_to_transfer = []
 
-        for file_path in source_path.rglob("*"):
-            if file_path.is_file():
-                # Calculate relative path for FTP
-                rel_path = file_path.relative_to(source_path)
-                ftp_file_path = (
-                    f"{target_ftp_path}/{str(rel_path).replace(os.sep, '/')}"
-                )
-
-                # Check if file already exists on FTP server
-                file_exists = self._check_ftp_file_exists(
-                    ftp_client, ftp_file_path, file_path
-                )
-
-                if not file_exists:
-                    files_to_transfer.append((file_path, ftp_file_path))
-                    total_size += file_path.stat().st_size
+        for (file_path, ftp_file_path, file_size), file_exists in zip(
+            local_files, exists
+        ):
+            if not file_exists:
+                files_to_transfer.append((file_path, ftp_file_path, file_size))
+                total_size += file_size
 
         if not files_to_transfer:
             # All files already exist, emit 100% progress and return
             self.file_progress.emit(game.name, 100)
             return
 
-        # Keep track of created directories to avoid redundant creation
-        created_dirs = set()
-        created_dirs.add(target_ftp_path)
+        # Group uploads by directory so each session rarely needs to CWD
+        # between consecutive files
+        files_to_transfer.sort(key=lambda item: item[1].rsplit("/", 1)[0])
+
+        # Create every destination directory once up front; sorting puts
+        # parents ahead of their children
+        for ftp_dir in sorted(
+            {
+                ftp_file_path.rsplit("/", 1)[0]
+                for _, ftp_file_path, _ in files_to_transfer
+            }
+        ):
+            self._ensure_dir(ftp_client, ftp_dir)
+
+        # Upload files that don't exist, spread across the upload sessions
+        self._uploaded_size = 0
+        upload_callback = self._make_upload_callback(game.name, total_size)
+        uploaded = self._run_on_sessions(
+            ftp_client,
+            self._upload_file,
+            [
+                (file_path, ftp_file_path, game.name, upload_callback)
+                for file_path, ftp_file_path, _ in files_to_transfer
+            ],
+        )
+        for client in self._upload_clients:
+            self._finish_store(client)
+
+        # Keep the cached listing current so a later game in this run sees
+        # these files without listing the directory again
+        for (_, ftp_file_path, file_size), done in zip(files_to_transfer, uploaded):
+            if done:
+                self._remote_files[ftp_file_path] = file_size
+
+    @staticmethod
+    def _list_local_files(folder_path: str, target_ftp_path: str) -> list:
+        """Return (file_path, ftp_file_path, size) for every file in a game"""
+        return [
+            (file_path, f"{target_ftp_path}/{rel_path}", file_size)
+            for file_path, rel_path, file_size in SystemUtils.iter_files(
+                folder_path, sep="/"
+            )
+        ]
+
+    def _run_on_sessions(self, ftp_client: FTPClient, func, tasks: list) -> list:
+        """Run func(session, *task) for each task across the upload sessions
+
+        Each session handles one command at a time, so a session is checked
+        out of a queue for the duration of a task. Results come back in task
+        order; tasks not yet started when a stop is requested return None.
+        """
+        if not tasks:
+            return []
 
-        # Upload files that don't exist
-        uploaded_size = 0
+        clients = queue.SimpleQueue()
+        for client in self._get_upload_clients(ftp_client, len(tasks)):
+            clients.put(client)
 
-        for file_path, ftp_file_path in files_to_transfer:
+        def run_task(task):
             if self.should_stop:
-                break
+                return None
 
-            # Create parent directories on FTP server if needed
-            ftp_dir = "/".join(ftp_file_path.split("/")[:-1])
+            client = clients.get()
+            try:
+                return func(client, *task)
+            finally:
+                clients.put(client)
 
-            # Create all parent directories recursively
-            if ftp_dir not in created_dirs:
-                self._create_ftp_directories_recursive(
-                    ftp_client, ftp_dir, created_dirs
+        with ThreadPoolExecutor(max_workers=clients.qsize()) as executor:
+            futures = [executor.submit(run_task, task) for task in tasks]
+            try:
+                return [future.result() for future in futures]
+            except Exception:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+
+    def _get_upload_clients(self, ftp_client: FTPClient, file_count: int):
+        """Return the sessions to upload with, opening extra ones on first use
+
+        Extra sessions that fail to connect are skipped, so servers with a
+        connection limit still work with whatever they accept.
+        """
+        if not self._upload_clients:
+            self._upload_clients = [ftp_client]
+
+        wanted = min(self.max_connections, file_count)
+        missing = wanted - len(self._upload_clients)
+        if missing > 0:
+            # Log the sessions in concurrently rather than one handshake
+            # after another
+            with ThreadPoolExecutor(max_workers=missing) as executor:
+                clients = list(
+                    executor.map(
+                        lambda _: self._connect_upload_client(), range(missing)
+                    )
                 )
+            connected = [client for client in clients if client is not None]
+            self._upload_clients.extend(connected)
+            if len(connected) < missing:
+                # Don't retry for later games either
+                self.max_connections = len(self._upload_clients)
+
+        return self._upload_clients[:wanted]
+
+    def _connect_upload_client(self) -> Optional[FTPClient]:
+        """Open an extra upload session, or None if the server refuses it"""
+        client = FTPClient()
+        success, _ = client.connect(
+            self.ftp_host, self.ftp_username, self.ftp_password, self.ftp_port
+        )
+        if not success:
+            client.disconnect()
+            return None
+        return client
+
+    def _make_upload_callback(self, game_name: str, total_size: int):
+        """Build the per-block callback that tracks a game's shared progress
+
+        One callback serves every file and session of the game instead of a
+        new closure per file.
+        """
+        if total_size <= 0:
+            return lambda sent: None
+
+        def upload_callback(sent):
+            with self._progress_lock:
+                self._uploaded_size += sent
+
+                # Most blocks arrive well inside the emit interval; skip the
+                # percentage maths for those
+                current_time = time.monotonic()
+                if (
+                    current_time - self._last_progress_time >= self.PROGRESS_INTERVAL
+                    or self._uploaded_size >= total_size
+                ):
+                    # Integer maths so a finished game always lands on exactly 100
+                    progress_percent = self._uploaded_size * 100 // total_size
+                    self._emit_file_progress(game_name, progress_percent)
+
+                    # Calculate and emit transfer speed every second
+                    if (
+                        current_time - self._last_speed_update >= 1.0
+                    ):  # Update every second
+                        elapsed_time = current_time - self._transfer_start_time
+                        if elapsed_time > 0:
+                            speed_bps = self._uploaded_size / elapsed_time
+                            self.transfer_speed.emit(game_name, speed_bps)
+                        self._last_speed_update = current_time
+
+        return upload_callback
+
+    def _upload_file(
+        self,
+        ftp_client: FTPClient,
+        file_path: str,
+        ftp_file_path: str,
+        game_name: str,
+        upload_callback,
+    ):
+        """Upload a single file on the given session, reporting shared progress"""
+        ftp_dir, filename = ftp_file_path.rsplit("/", 1)
 
-            # Emit current file being transferred
-            filename = file_path.name
-            self.current_file.emit(game.name, filename)
+        # Emit current file being transferred. Small files finish far faster
+        # than the UI can show them, so this is throttled like file_progress
+        now = time.monotonic()
+        if now - self._last_file_time >= self.PROGRESS_INTERVAL:
+            self._last_file_time = now
+            self.current_file.emit(game_name, filename)
+
+        try:
+            local_file = open(file_path, "rb")
+        except OSError as e:
+            raise Exception(f"Failed to upload {file_path}: {str(e)}")
+
+        with local_file:
+            # Change working directory only when it differs from this
+            # session's last upload. The CWD goes out before the previous
+            # STOR's reply is read, so the two share a round-trip
+            change_dir = self._client_dirs.get(ftp_client) != ftp_dir
+            if change_dir:
+                ftp_client._ftp.putcmd(f"CWD {ftp_dir}")
+            self._finish_store(ftp_client)
 
             try:
-                with open(file_path, "rb") as local_file:
-                    # Use callback for progress tracking
-                    uploaded_bytes = 0
-
-                    def upload_callback(data):
-                        nonlocal uploaded_bytes, uploaded_size
-                        uploaded_bytes += len(data)
-                        uploaded_size += len(data)
-
-                        if total_size > 0:
-                            progress_percent = int((uploaded_size / total_size) * 100)
-                            self.file_progress.emit(game.name, progress_percent)
-
-                            # Calculate and emit transfer speed every second
-                            current_time = time.time()
-                            if (
-                                current_time - self._last_speed_update >= 1.0
-                            ):  # Update every second
-                                elapsed_time = current_time - self._transfer_start_time
-                                if elapsed_time > 0:
-                                    speed_bps = uploaded_size / elapsed_time
-                                    self.transfer_speed.emit(game.name, speed_bps)
-                                self._last_speed_update = current_time
-
-                    # Change working directory to the correct path before upload
+                fadvise = hasattr(os, "posix_fadvise") and (
+                    os.fstat(local_file.fileno()).st_size > FADVISE_MIN_SIZE
+                )
+                if fadvise:
+                    os.posix_fadvise(
+                        local_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL
+                    )
+
+                if change_dir:
                     try:
-                        ftp_client._ftp.cwd(ftp_dir)
+                        ftp_client._ftp.voidresp()
                     except Exception:
                         # Try to create the directory again
-                        self._create_ftp_directories_recursive(
-                            ftp_client, ftp_dir, created_dirs
-                        )
+                        self._created_dirs.discard(ftp_dir)
+                        self._ensure_dir(ftp_client, ftp_dir)
                         ftp_client._ftp.cwd(ftp_dir)
+                    self._client_dirs[ftp_client] = ftp_dir
 
-                    # Upload file using just the filename (since we're in the correct directory)
-                    filename = ftp_file_path.split("/")[-1]
-                    ftp_client._ftp.storbinary(
-                        f"STOR {filename}", local_file, callback=upload_callback
-                    )
+                # Upload file using just the filename (since we're in the correct directory)
+                self._store_file(ftp_client, filename, local_file, upload_callback)
+
+                # Each file is read once; drop its pages so a large game does
+                # not evict the cache for the rest of the system
+                if fadvise:
+                    os.posix_fadvise(local_file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
 
             except Exception as e:
                 raise Exception(f"Failed to upload {file_path}: {str(e)}")
 
+        # The server's final reply is read before this session's next command
+        self._pending_stores[ftp_client] = file_path
+        return True
+
+    def _finish_store(self, ftp_client: FTPClient):
+        """Read the final reply of the session's last STOR, if still pending"""
+        file_path = self._pending_stores.pop(ftp_client, None)
+        if file_path is None:
+            return
+        try:
+            ftp_client._ftp.voidresp()
+        except ftplib.all_errors as e:
+            raise Exception(f"Failed to upload {file_path}: {str(e)}")
+
+    def _store_file(self, ftp_client: FTPClient, filename: str, local_file, callback):
+        """STOR a file, calling callback(bytes) after each slice is sent
+
+        Equivalent to ftplib's storbinary, but where the OS supports it the
+        kernel copies the file straight into the data socket with sendfile.
+        Elsewhere (Windows, FTPS) a single reused buffer is sent per slice.
+        The session is already in binary mode, so no TYPE I is sent, and the
+        final transfer reply is left for the caller to read.
+        """
+        with ftp_client._ftp.transfercmd(f"STOR {filename}") as conn:
+            if hasattr(os, "sendfile") and not isinstance(conn, ssl.SSLSocket):
+                offset = 0
+                while True:
+                    sent = conn.sendfile(local_file, offset, self.buffer_size)
+                    if not sent:
+                        break
+                    offset += sent
+                    callback(sent)
+            else:
+                buffer = bytearray(self.buffer_size)
+                view = memoryview(buffer)
+                while True:
+                    read = local_file.readinto(buffer)
+                    if not read:
+                        break
+                    conn.sendall(view[:read])
+                    callback(read)
+
+            # FTPS: close the TLS layer cleanly before the socket
+            if isinstance(conn, ssl.SSLSocket):
+                conn.unwrap()
+
     def _check_ftp_file_exists(
-        self, ftp_client: FTPClient, ftp_file_path: str, local_file_path: Path
+        self, ftp_client: FTPClient, file_path: str, ftp_file_path: str, local_size: int
     ) -> bool:
-        """Check if a file exists on the FTP server and optionally compare size"""
+        """Check if a file already exists on the FTP server with the same content
+
+        Compares sizes, then CRC32s when the server supports XCRC so a
+        different file that happens to have the same size is still uploaded.
+        When either CRC can't be had, the size match decides, as it does
+        without XCRC; only two CRCs that differ cause a re-upload.
+        """
+        if not self._remote_size_matches(ftp_client, ftp_file_path, local_size):
+            return False
+
+        if not self._xcrc_supported:
+            return True
+
+        remote_crc = self._remote_crc32(ftp_client, ftp_file_path)
+        if remote_crc is None:
+            return True
         try:
-            # Try to get file size from FTP server
-            ftp_client._ftp.voidcmd("TYPE I")  # Set binary mode for size command
+            st = os.stat(file_path)
+            local_crc = _cached_file_crc32(file_path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            return True
+        return remote_crc == local_crc
+
+    def _remote_size_matches(
+        self, ftp_client: FTPClient, ftp_file_path: str, local_size: int
+    ) -> bool:
+        """Check if a file exists on the FTP server with the given size"""
+        if self._remote_sizes is not None:
+            return self._remote_sizes.get(ftp_file_path) == local_size
+
+        # MLST answers existence, type and size in one command
+        facts = self._mlst_facts(ftp_client, ftp_file_path)
+        if facts is not None:
+            return facts.get("type") == "file" and facts.get("size") == str(local_size)
+
+        try:
+            # Try to get file size from FTP server (session is already in binary mode)
             ftp_size = ftp_client._ftp.size(ftp_file_path)
 
             if ftp_size is not None:
                 # Compare with local file size
-                local_size = local_file_path.stat().st_size
                 return ftp_size == local_size
 
             return False
@@ -213,25 +512,216 @@ class FTPTransferWorker(QThread):
             # assume file doesn't exist or needs to be re-uploaded
             return False
 
-    def _create_ftp_directories_recursive(
-        self, ftp_client: FTPClient, ftp_path: str, created_dirs: set
-    ):
-        """Create FTP directories recursively"""
-        if ftp_path in created_dirs or ftp_path in ["/", ""]:
-            return
+    def _remote_crc32(self, ftp_client: FTPClient, ftp_file_path: str) -> Optional[int]:
+        """CRC32 of a remote file via XCRC, or None if it can't be had"""
+        if not self._xcrc_supported:
+            return None
+        ftp = ftp_client._ftp
+        try:
+            ftp.sock.settimeout(XCRC_TIMEOUT)
+            try:
+                response = ftp.sendcmd(f"XCRC {ftp_file_path}")
+            finally:
+                ftp.sock.settimeout(ftp.timeout)
+            # Reply is "250 <hex>", some servers add text before the value
+            return int(response.split()[-1], 16)
+        except ftplib.error_perm as e:
+            if not str(e).startswith("550"):
+                self._xcrc_supported = False
+            return None
+        except ValueError:
+            # Not usable for this server after all; stick to sizes
+            self._xcrc_supported = False
+            return None
+        except (OSError, EOFError):
+            # The reply never arrived, so it may still turn up later and be
+            # read as the answer to another command. The session can't be
+            # trusted any more, and neither can XCRC on this server
+            self._xcrc_supported = False
+            self._reconnect(ftp_client)
+            return None
+        except ftplib.all_errors:
+            return None
+
+    def _reconnect(self, ftp_client: FTPClient):
+        """Replace a session whose replies are out of step with a fresh one"""
+        try:
+            ftp_client._ftp.close()
+        except Exception:
+            pass
+        self._client_dirs.pop(ftp_client, None)
+        self._pending_stores.pop(ftp_client, None)
+        success, message = ftp_client.connect(
+            self.ftp_host, self.ftp_username, self.ftp_password, self.ftp_port
+        )
+        if not success:
+            raise Exception(f"FTP reconnection failed: {message}")
 
-        # Get parent directory
-        parent_dir = "/".join(ftp_path.split("/")[:-1])
-        if parent_dir and parent_dir not in created_dirs:
-            self._create_ftp_directories_recursive(ftp_client, parent_dir, created_dirs)
+    @staticmethod
+    def _server_supports(ftp_client: FTPClient, feature: str) -> bool:
+        """Check whether FEAT lists the given feature"""
+        try:
+            response = ftp_client._ftp.sendcmd("FEAT")
+        except ftplib.all_errors:
+            return False
+        return any(
+            line.strip().upper().split(" ", 1)[0] == feature
+            for line in response.splitlines()[1:-1]
+        )
 
-        # Create current directory
-        success, message = ftp_client.create_directory(ftp_path)
-        if success:
-            created_dirs.add(ftp_path)
-        else:
-            # If creation fails but directory exists, that's ok
-            if "exists" not in message.lower():
-                raise Exception(f"Failed to create directory {ftp_path}: {message}")
-            else:
-                created_dirs.add(ftp_path)
+    def _mlst_facts(
+        self, ftp_client: FTPClient, ftp_path: str
+    ) -> Optional[Dict[str, str]]:
+        """Return the MLST facts for ftp_path, {} if it can't be found
+
+        Returns None once the server has rejected MLST, so callers fall back
+        to their older probe.
+        """
+        if not self._mlst_supported:
+            return None
+        try:
+            response = ftp_client._ftp.sendcmd(f"MLST {ftp_path}")
+        except ftplib.error_perm as e:
+            # 550: no such path; anything else means MLST isn't supported
+            if str(e).startswith("550"):
+                return {}
+            self._mlst_supported = False
+            return None
+        except ftplib.all_errors:
+            return {}
+        return self._parse_mlst_facts(response)
+
+    @staticmethod
+    def _parse_mlst_facts(response: str) -> Dict[str, str]:
+        """Parse the facts line of an MLST reply into a lowercase dict
+
+        The reply looks like "250-Start", " type=file;size=123; /path",
+        "250 End"; the facts are on the indented middle line.
+        """
+        for line in response.splitlines()[1:]:
+            if line.startswith(" "):
+                facts_text = line.strip().split(" ", 1)[0]
+                facts = {}
+                for fact in facts_text.split(";"):
+                    key, _, value = fact.partition("=")
+                    if key:
+                        facts[key.lower()] = value.lower()
+                return facts
+        return {}
+
+    def _ftp_walk_sizes(
+        self, ftp_client: FTPClient, root: str
+    ) -> Optional[Dict[str, int]]:
+        """Map every file under an FTP directory to its size, one MLSD per directory
+
+        Directories already listed (or created) earlier in the run are served
+        from the cached listing. Returns None if the server doesn't support
+        MLSD, in which case _check_ftp_file_exists falls back to a SIZE command
+        per file.
+        """
+        if not self._mlsd_supported:
+            return None
+
+        try:
+            return self._walk_sizes_mlsd(ftp_client, root)
+        finally:
+            # MLSD switches the session to ASCII mode; put it back once here
+            # rather than before every later SIZE probe
+            try:
+                ftp_client._ftp.voidcmd("TYPE I")
+            except ftplib.all_errors:
+                pass
+
+    def _walk_sizes_mlsd(
+        self, ftp_client: FTPClient, root: str
+    ) -> Optional[Dict[str, int]]:
+        """Body of _ftp_walk_sizes; may leave the session in ASCII mode"""
+        pending = [root]
+
+        while pending:
+            path = pending.pop()
+            if path in self._listed_dirs:
+                pending.extend(self._listed_dirs[path])
+                continue
+
+            try:
+                entries = list(ftp_client._ftp.mlsd(path, facts=["type", "size"]))
+            except ftplib.error_perm as e:
+                # 550: directory doesn't exist yet, so nothing below it does either
+                if str(e).startswith("550"):
+                    continue
+                self._mlsd_supported = False
+                return None
+            except ftplib.Error:
+                self._mlsd_supported = False
+                return None
+
+            subdirs = set()
+            for name, facts in entries:
+                entry_type = facts.get("type", "").lower()
+                if entry_type == "dir":
+                    subdirs.add(f"{path}/{name}")
+                elif entry_type == "file" and "size" in facts:
+                    self._remote_files[f"{path}/{name}"] = int(facts["size"])
+
+            self._created_dirs.add(path)
+            self._created_dirs.update(subdirs)
+            self._listed_dirs[path] = subdirs
+            pending.extend(subdirs)
+
+        return self._remote_files
+
+    def _ensure_dir(self, ftp_client: FTPClient, ftp_path: str):
+        """Create an FTP directory and any missing parents
+
+        Walks up from ftp_path to the nearest directory known or found to
+        exist, then creates only the missing levels below it, so an existing
+        tree costs a single probe rather than an MKD per level.
+        """
+        missing = []
+        path = ftp_path
+        while path not in self._created_dirs and path not in ("/", ""):
+            # dirname also ends the walk for a relative path like "Hdd1/Games",
+            # where splitting on the last "/" would return "Hdd1" forever
+            parent = posixpath.dirname(path)
+            if parent == path:
+                break
+            if parent not in self._listed_dirs and self._remote_dir_exists(
+                ftp_client, path
+            ):
+                self._created_dirs.add(path)
+                break
+            missing.append(path)
+            path = parent
+
+        for path in reversed(missing):
+            success, message = ftp_client.create_directory(path)
+            if not success:
+                raise Exception(f"Failed to create directory {path}: {message}")
+            self._created_dirs.add(path)
+            self._listed_dirs[path] = set()
+            parent_subdirs = self._listed_dirs.get(posixpath.dirname(path))
+            if parent_subdirs is not None:
+                parent_subdirs.add(path)
+
+    def _remote_dir_exists(self, ftp_client: FTPClient, ftp_path: str) -> bool:
+        """Check for a remote directory with one MLST instead of PWD/CWD/CWD"""
+        facts = self._mlst_facts(ftp_client, ftp_path)
+        if facts is not None:
+            return facts.get("type") in ("dir", "cdir")
+        return ftp_client.directory_exists(ftp_path)
+
+    def stop(self):
+        """Ask the transfer to stop before the next file"""
+        self.should_stop = True
+
+    def _emit_file_progress(self, game_name, percent):
+        """Emit file_progress on a percentage change, at most every PROGRESS_INTERVAL"""
+        if percent == self._last_progress_percent:
+            return
+
+        now = time.monotonic()
+        if percent >= 100 or now - self._last_progress_time >= self.PROGRESS_INTERVAL:
+            self.file_progress.emit(game_name, percent)
+            self._last_progress_percent = percent
+            self._last_progress_time = now
@@ -1,20 +1,262 @@
 import base64
 import ctypes
+import functools
+import hashlib
+import json
+import operator
+import os
 import struct
-import urllib.error
-import urllib.request
+import sys
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Tuple, cast
+from typing import Dict, List, Optional, Set, Tuple
 
+import requests
 from PyQt6.QtCore import QThread, pyqtSignal
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtGui import QImage, QPixmap
 from xbe import StructurePrintMixin, Xbe  # type: ignore
 
 from utils.system_utils import SystemUtils
-from utils.xboxunity import XboxUnity
+from utils.xboxunity import XboxUnity, cached_god_info
+
+# Icons are small, so a batch is bound by round-trips; fetch several at once
+# over one keep-alive session
+ICON_DOWNLOAD_WORKERS = 8
+ICON_DOWNLOAD_TIMEOUT = 30
+
+# Titles the icon sources have no image for are remembered for this long
+# (seconds) so each launch doesn't ask for them again
+ICON_MISS_TTL = 7 * 24 * 60 * 60
+
+# Qt maps PNG quality onto the zlib level as (100 - quality) * 9 // 91, so 50
+# is level 4: several times faster to encode than the default for icons a
+# few percent larger
+ICON_PNG_QUALITY = 50
+
+_session = requests.Session()
+
+# The four 2-bit palette indices packed into each byte (one row of a 4x4 block)
+# of a BC1/BC2/BC3 color index word, lowest bits first
+_BC_ROW_INDICES = tuple(
+    tuple((row >> shift) & 3 for shift in (0, 2, 4, 6)) for row in range(256)
+)
+
+# 5- and 6-bit color channels expanded to 8 bits
+_EXPAND_5BIT = tuple(x * 255 // 31 for x in range(32))
+_EXPAND_6BIT = tuple(x * 255 // 63 for x in range(64))
+
+# BC2 explicit alpha: bytes.translate tables expanding the low and high
+# 4-bit alpha of each byte to 8 bits
+_BC2_ALPHA_LOW = bytes((pair & 0xF) * 17 for pair in range(256))
+_BC2_ALPHA_HIGH = bytes((pair >> 4) * 17 for pair in range(256))
+
+# BC3 interpolated alpha: the four 3-bit palette indices packed into each
+# 12-bit row of the alpha index word, as a getter over the 8-entry palette
+_BC3_ALPHA_ROWS = tuple(
+    operator.itemgetter(*((row >> shift) & 7 for shift in (0, 3, 6, 9)))
+    for row in range(4096)
+)
+
+# The DDS header fields the decoder needs, read in one call: magic, then
+# height and width from DDS_HEADER (after size and flags), then the
+# DDS_PIXELFORMAT fourcc, RGB bit count and R/G/B/A masks. The skipped 64
+# bytes are pitch, depth, mip count, 44 reserved bytes and the pixel
+# format's size and flags; the trailing 20 are caps and reserved fields
+_DDS_HEADER = struct.Struct("<I8x2I64x6I20x")
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_xex_info(path: str, mtime_ns: int, size: int) -> Optional[Dict]:
+    """Run xextool on a XEX, memoized by path, mtime and size"""
+    return SystemUtils.extract_xex_info(path)
+
+
+@functools.lru_cache(maxsize=4096)
+def _bc_colors(
+    c0_raw: int, c1_raw: int, punch_through: bool
+) -> Tuple[bytes, bytes, bytes, bytes]:
+    """
+    Build the 4-entry RGBA palette of a BC1/BC2/BC3 color block
+
+    The two 565 endpoints are expanded to 8 bits and the middle entries
+    interpolated at 1/3 and 2/3, or, in BC1's punch-through mode, at 1/2
+    followed by a transparent black entry. Palettes are cached since
+    neighbouring blocks of an icon often share their endpoints.
+    """
+    expand5, expand6 = _EXPAND_5BIT, _EXPAND_6BIT
+    r0 = expand5[c0_raw >> 11]
+    g0 = expand6[(c0_raw >> 5) & 0x3F]
+    b0 = expand5[c0_raw & 0x1F]
+    r1 = expand5[c1_raw >> 11]
+    g1 = expand6[(c1_raw >> 5) & 0x3F]
+    b1 = expand5[c1_raw & 0x1F]
+    if punch_through:
+        return (
+            bytes((r0, g0, b0, 255)),
+            bytes((r1, g1, b1, 255)),
+            bytes(((r0 + r1) // 2, (g0 + g1) // 2, (b0 + b1) // 2, 255)),
+            bytes(4),
+        )
+    return (
+        bytes((r0, g0, b0, 255)),
+        bytes((r1, g1, b1, 255)),
+        bytes(((2 * r0 + r1) // 3, (2 * g0 + g1) // 3, (2 * b0 + b1) // 3, 255)),
+        bytes(((r0 + 2 * r1) // 3, (g0 + 2 * g1) // 3, (b0 + 2 * b1) // 3, 255)),
+    )
+
+
+def _rgba_table(high: List[int], low: List[int]) -> array:
+    """
+    Build the RGBA of every 16-bit pixel value from two partial tables
+
+    high holds the RGBA word contributed by each value of the pixel's upper
+    fields and low that of its lower fields; each entry ORs one of each, so
+    the 65536 entries need no per-entry arithmetic. Words are laid out so
+    their bytes read R, G, B, A in memory, which lets a whole image be
+    expanded with one table lookup per pixel.
+    """
+    table = array("I", [h | lo for h in high for lo in low])
+    if sys.byteorder == "big":
+        table.byteswap()
+    return table
 
-if TYPE_CHECKING:
-    RGBA = Tuple[float, float, float, float]
+
+@functools.cache
+def _r5g6b5_table() -> array:
+    """RGBA of every R5G6B5 value, built on first use"""
+    r5, g6 = _EXPAND_5BIT, _EXPAND_6BIT
+    return _rgba_table(
+        [0xFF000000 | r | g << 8 for r in r5 for g in g6], [b << 16 for b in r5]
+    )
+
+
+@functools.cache
+def _a1r5g5b5_table(opaque: bool) -> array:
+    """RGBA of every A1R5G5B5 value (alpha ignored if opaque), built on first use"""
+    c5 = _EXPAND_5BIT
+    alphas = (0xFF000000, 0xFF000000) if opaque else (0, 0xFF000000)
+    return _rgba_table(
+        [a | r for a in alphas for r in c5], [g << 8 | b << 16 for g in c5 for b in c5]
+    )
+
+
+@functools.cache
+def _a4r4g4b4_table() -> array:
+    """RGBA of every A4R4G4B4 value, built on first use"""
+    c4 = [x * 17 for x in range(16)]
+    return _rgba_table(
+        [a << 24 | r for a in c4 for r in c4],
+        [g << 8 | b << 16 for g in c4 for b in c4],
+    )
+
+
+def _expand_16bit_pixels(data: bytes, count: int, table: array) -> bytes:
+    """Expand count little-endian 16-bit pixels to RGBA bytes through a table"""
+    values = struct.unpack(f"<{count}H", data[: count * 2])
+    return array("I", map(table.__getitem__, values)).tobytes()
+
+
+@functools.lru_cache(maxsize=4096)
+def _bc3_alphas(endpoints: int) -> Tuple[int, ...]:
+    """
+    Build the 8-entry alpha palette of a BC3 block from its two endpoint bytes
+
+    Blocks in an icon share a handful of endpoint pairs (fully opaque
+    regions all use the same one), so palettes are memoized rather than
+    interpolated per block.
+    """
+    a0 = endpoints & 0xFF
+    a1 = endpoints >> 8
+    if a0 > a1:
+        return (
+            a0,
+            a1,
+            (6 * a0 + 1 * a1) // 7,
+            (5 * a0 + 2 * a1) // 7,
+            (4 * a0 + 3 * a1) // 7,
+            (3 * a0 + 4 * a1) // 7,
+            (2 * a0 + 5 * a1) // 7,
+            (1 * a0 + 6 * a1) // 7,
+        )
+    return (
+        a0,
+        a1,
+        (4 * a0 + 1 * a1) // 5,
+        (3 * a0 + 2 * a1) // 5,
+        (2 * a0 + 3 * a1) // 5,
+        (1 * a0 + 4 * a1) // 5,
+        0,
+        255,
+    )
+
+
+def _bgra_to_rgba(data: bytes, opaque: bool = False) -> bytearray:
+    """
+    Reorder 32-bit little-endian ARGB pixels (B, G, R, A bytes) to RGBA
+
+    Each channel is moved for the whole image with one extended slice copy;
+    with opaque set the stored alpha is ignored and every pixel is made
+    fully opaque (the X8R8G8B8 formats).
+    """
+    pixels = bytearray(data)
+    pixels[0::4] = data[2::4]
+    pixels[2::4] = data[0::4]
+    if opaque:
+        pixels[3::4] = b"\xff" * (len(data) // 4)
+    return pixels
+
+
+@functools.lru_cache(maxsize=16)
+def _bc_block_offsets(width: int, height: int) -> Tuple[int, ...]:
+    """
+    Byte offset of each 4x4 block's top-left pixel in an RGBA8 image
+
+    Blocks are stored left to right, top to bottom, so the offsets are
+    returned in that order for zipping against the unpacked blocks.
+    """
+    stride = width * 4
+    return tuple(
+        row + column
+        for row in range(0, stride * height, stride * 4)
+        for column in range(0, stride, 16)
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _deswizzle_gather(width: int, height: int):
+    """
+    Build a callable that reorders swizzled pixels into linear order
+
+    Xbox textures are stored in Z-order (Morton order) within the smallest
+    power-of-2 square holding the image. The swizzled index of every linear
+    position only depends on the texture size, so it is worked out once per
+    size and the reorder itself runs in C via itemgetter. Positions outside
+    the source map to index width * height, which callers fill with a
+    transparent pixel.
+    """
+    num_pixels = width * height
+    log_size = max(width, height).bit_length() - 1
+    if 1 << log_size < max(width, height):
+        log_size += 1
+
+    def spread(value: int) -> int:
+        result = 0
+        for i in range(log_size):
+            if value & (1 << i):
+                result |= 1 << (2 * i)
+        return result
+
+    x_bits = [spread(x) for x in range(width)]
+    y_bits = [spread(y) << 1 for y in range(height)]
+    indices = [
+        index if index < num_pixels else num_pixels
+        for y in y_bits
+        for index in (y | x for x in x_bits)
+    ]
+    return operator.itemgetter(*indices)
 
 
 class IconDownloader(QThread):
@@ -37,26 +279,121 @@ class IconDownloader(QThread):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.system_utils = SystemUtils()
         self.xbox_unity = XboxUnity()
+        self._misses_file = self.cache_dir / ".misses.json"
+        self._misses = self._load_misses()
+        self._misses_lock = threading.Lock()
+        self._misses_changed = False
+        # XBX images already decoded this run, keyed by a digest of the data
+        self._converted_images: Dict[bytes, QImage] = {}
+        # Names of the files in the cache directory, listed once per run
+        self._cached_names: Set[str] = set()
 
     def run(self):
-        for title_id, folder_name in self.title_ids:
-            try:
-                pixmap = self._get_or_download_icon(title_id, folder_name)
-                if pixmap:
+        # One directory listing answers every "is it cached?" check below
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                self._cached_names = {entry.name for entry in entries}
+        except OSError:
+            self._cached_names = set()
+
+        # Cached and game-file icons are resolved here in order; downloads go
+        # to a pool so their round-trips overlap with each other and with the
+        # local work
+        with ThreadPoolExecutor(max_workers=ICON_DOWNLOAD_WORKERS) as executor:
+            downloads = {}
+            for title_id, folder_name in self.title_ids:
+                try:
+                    pixmap = self._get_local_icon(title_id, folder_name)
+                except Exception:
+                    pixmap = QPixmap()
+                if not pixmap.isNull():
                     self.icon_downloaded.emit(title_id, pixmap)
+                elif self._is_known_miss(title_id):
+                    self.download_failed.emit(title_id)
                 else:
+                    future = executor.submit(self._download_icon, title_id)
+                    downloads[future] = title_id
+
+            for future in as_completed(downloads):
+                title_id = downloads[future]
+                try:
+                    pixmap = QPixmap()
+                    data = future.result()
+                    if data is not None:
+                        # Only a response that decodes as an image is cached;
+                        # the sources serve PNGs, so try that decoder first
+                        if not pixmap.loadFromData(data, "PNG"):
+                            pixmap.loadFromData(data)
+                        if pixmap.isNull():
+                            self._record_miss(title_id)
+                        else:
+                            self._write_cache_file(
+                                self.cache_dir / f"{title_id}.png", data
+                            )
+                    if not pixmap.isNull():
+                        self.icon_downloaded.emit(title_id, pixmap)
+                    else:
+                        self.download_failed.emit(title_id)
+                except Exception:
                     self.download_failed.emit(title_id)
-            except Exception:
-                self.download_failed.emit(title_id)
 
-    def _get_or_download_icon(self, title_id: str, folder_name: str) -> QPixmap:
-        """Get icon from cache or download it"""
+        self._save_misses()
+
+    def _load_misses(self) -> Dict[str, float]:
+        """Load the title IDs with no upstream icon, dropping expired entries"""
+        try:
+            with open(self._misses_file, "r", encoding="utf-8") as f:
+                misses = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(misses, dict):
+            return {}
+
+        cutoff = time.time() - ICON_MISS_TTL
+        return {
+            title_id: missed_at
+            for title_id, missed_at in misses.items()
+            if missed_at > cutoff
+        }
+
+    def _save_misses(self):
+        """Write the missing icon list back if this run changed it"""
+        with self._misses_lock:
+            if not self._misses_changed:
+                return
+            misses = dict(self._misses)
+            self._misses_changed = False
+
+        try:
+            with open(self._misses_file, "w", encoding="utf-8") as f:
+                json.dump(misses, f, indent=2)
+        except OSError as e:
+            print(f"Error saving missing icon list: {e}")
+
+    def _is_known_miss(self, title_id: str) -> bool:
+        """Check whether a title recently had no icon to download"""
+        with self._misses_lock:
+            missed_at = self._misses.get(title_id)
+        return missed_at is not None and time.time() - missed_at < ICON_MISS_TTL
+
+    def _record_miss(self, title_id: str):
+        """Remember that a title has no icon so it isn't requested again"""
+        with self._misses_lock:
+            self._misses[title_id] = time.time()
+            self._misses_changed = True
+
+    def _get_local_icon(self, title_id: str, folder_name: str) -> QPixmap:
+        """Get icon from cache or the game's own files"""
         cache_file = self.cache_dir / f"{title_id}.png"
 
-        # Check if cached version exists
-        if cache_file.exists():
-            pixmap = QPixmap(str(cache_file))
-            if not pixmap.isNull():
+        # Check if cached version exists and is newer than the game's XBE
+        if cache_file.name in self._cached_names and not self._is_xbe_newer(
+            cache_file, folder_name
+        ):
+            # Everything cached is written as PNG, so skip format detection
+            # unless the file turns out to be something else
+            pixmap = QPixmap()
+            if pixmap.load(str(cache_file), "PNG") or pixmap.load(str(cache_file)):
                 return pixmap
 
         # Check if this is an extracted ISO game (default.xex), GoD game, or Xbox game (default.xbe)
@@ -92,33 +429,65 @@ class IconDownloader(QThread):
                 if not icon_pixmap.isNull():
                     return icon_pixmap
 
-        # Download from Xbox Unity or MobCat
-        try:
-            if self.platform in ["xbox360", "xbla"]:
-                # url = f"https://xboxunity.net/Resources/Lib/Icon.php?tid={title_id}&custom=1"
-                url = f"https://raw.githubusercontent.com/UncreativeXenon/XboxUnity-Scraper/refs/heads/master/Icons/{title_id}.png"
-            else:
-                url = f"https://raw.githubusercontent.com/MobCat/MobCats-original-xbox-game-list/main/icon/{title_id[:4]}/{title_id}.png"
+        return QPixmap()  # Return empty pixmap if there is no local icon
 
-            if not url:
-                return QPixmap()  # No URL available for this platform
+    def _is_xbe_newer(self, cache_file: Path, folder_name: str) -> bool:
+        """Check whether an Xbox game's XBE was replaced after its icon was cached"""
+        if self.platform != "xbox" or not self.current_directory:
+            return False
+        xbe_path = self.current_directory / folder_name / "default.xbe"
+        try:
+            return xbe_path.stat().st_mtime_ns > cache_file.stat().st_mtime_ns
+        except OSError:
+            return False
 
-            print(f"Downloading icon from {url}")
+    def _download_icon(self, title_id: str) -> Optional[bytes]:
+        """Download an icon from Xbox Unity or MobCat
 
-            urllib.request.urlretrieve(url, str(cache_file))
+        Runs on the download pool, so it only touches the network; the
+        caller checks the image and caches it.
+        """
+        if self.platform in ["xbox360", "xbla"]:
+            # url = f"https://xboxunity.net/Resources/Lib/Icon.php?tid={title_id}&custom=1"
+            url = f"https://raw.githubusercontent.com/UncreativeXenon/XboxUnity-Scraper/refs/heads/master/Icons/{title_id}.png"
+        else:
+            url = f"https://raw.githubusercontent.com/MobCat/MobCats-original-xbox-game-list/main/icon/{title_id[:4]}/{title_id}.png"
 
-            pixmap = QPixmap(str(cache_file))
-            if not pixmap.isNull():
-                return pixmap
-        except (urllib.error.URLError, urllib.error.HTTPError, Exception):
-            pass
+        print(f"Downloading icon from {url}")
 
-        return QPixmap()  # Return empty pixmap on failure
+        try:
+            response = _session.get(url, timeout=ICON_DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            # Only a definite "not there" is remembered; timeouts and
+            # connection errors are retried on the next run
+            if e.response is not None and e.response.status_code in (404, 410):
+                self._record_miss(title_id)
+            return None
+        except requests.RequestException:
+            return None
+
+        return response.content
+
+    def _write_cache_file(self, cache_file: Path, data: bytes):
+        """Write an icon to the cache through a temporary file
+
+        The rename is atomic, so an interrupted write never leaves a
+        truncated PNG behind for the next run to load.
+        """
+        temp_file = cache_file.with_name(f"{cache_file.name}.tmp")
+        try:
+            temp_file.write_bytes(data)
+            os.replace(temp_file, cache_file)
+            self._cached_names.add(cache_file.name)
+        except OSError as e:
+            print(f"Failed to cache icon {cache_file.name}: {e}")
 
     def _extract_icon_from_xex(self, xex_path: Path, expected_title_id: str) -> QPixmap:
         """Extract icon from XEX file using xextool"""
         try:
-            xex_info = self.system_utils.extract_xex_info(str(xex_path))
+            st = xex_path.stat()
+            xex_info = _cached_xex_info(str(xex_path), st.st_mtime_ns, st.st_size)
             if not xex_info:
                 return QPixmap()
 
@@ -135,12 +504,18 @@ class IconDownloader(QThread):
             # Decode base64 and create pixmap
             icon_data = base64.b64decode(icon_base64)
             pixmap = QPixmap()
-            pixmap.loadFromData(icon_data)
+            is_png = pixmap.loadFromData(icon_data, "PNG")
+            if not is_png:
+                pixmap.loadFromData(icon_data)
 
-            # Cache the icon for future use
+            # Cache the icon for future use. A PNG is written as-is; anything
+            # else is re-encoded so the cache only ever holds PNGs
             if not pixmap.isNull():
                 cache_file = self.cache_dir / f"{expected_title_id}.png"
-                pixmap.save(str(cache_file), "PNG")
+                if is_png:
+                    self._write_cache_file(cache_file, icon_data)
+                else:
+                    pixmap.save(str(cache_file), "PNG", ICON_PNG_QUALITY)
 
             return pixmap
 
@@ -161,7 +536,8 @@ class IconDownloader(QThread):
             header_file_path = str(header_files[0])
 
             # Extract GoD information including icon
-            god_info = self.xbox_unity.get_god_info(header_file_path)
+            st = os.stat(header_file_path)
+            god_info = cached_god_info(header_file_path, st.st_mtime_ns, st.st_size)
             if not god_info:
                 return QPixmap()
 
@@ -173,94 +549,27 @@ class IconDownloader(QThread):
                 pass
 
             # Get the icon data
-            icon_base64 = god_info.get("icon_base64")
-            if not icon_base64:
+            icon_data = god_info.get("icon_data")
+            if not icon_data:
                 return QPixmap()
 
-            # Decode base64 and create pixmap
-            icon_data = base64.b64decode(icon_base64)
             pixmap = QPixmap()
-            pixmap.loadFromData(icon_data)
+            pixmap.loadFromData(icon_data, "PNG")
 
-            # Cache the icon for future use (use the expected title ID for consistent caching)
+            # Cache the icon for future use (use the expected title ID for consistent caching).
+            # The header already holds a PNG, so write it as-is instead of re-encoding.
             if not pixmap.isNull():
                 cache_file = self.cache_dir / f"{expected_title_id}.png"
-                pixmap.save(str(cache_file), "PNG")
+                self._write_cache_file(cache_file, icon_data)
 
             return pixmap
 
         except Exception:
             return QPixmap()
 
-    def _encode_bmp(self, w: int, h: int, pixels: List["RGBA"]) -> bytes:
-        """
-        Encode a standard Windows BMP Image File
-        """
-        enc = b""
-        for y in range(h):
-            y = h - y - 1  # Bitmap encodes the image "bottom-up"
-            for x in range(w):
-                r, g, b, a = pixels[y * w + x]
-                enc += struct.pack(
-                    "<BBBB", int(255 * b), int(255 * g), int(255 * r), int(255 * a)
-                )
-
-        # Encode BITMAPV5HEADER
-        # https://docs.microsoft.com/en-us/windows/win32/api/wingdi/ns-wingdi-bitmapv5header
-        hdr = b"BM" + struct.pack(
-            "<3I 3I2H11I48x I12x",
-            # Bitmap File Header
-            14 + 124 + len(enc),  # Total size
-            0,  # Reserved
-            14 + 124,  # Offset to pixel array
-            # DIB Header
-            124,  # sizeof(BITMAPV5INFOHEADER)
-            w,
-            h,  # Image dimensions
-            1,  # No. color planes
-            32,  # BPP
-            3,  # BI_BITFIELDS
-            len(enc),  # Image size
-            2835,
-            2835,  # Horizontal, Vertical Resolution (72DPI)
-            0,  # Colors in palette (0=2^n)
-            0,  # Important colors (0=all colors)
-            0x00FF0000,  # Red channel bitmask
-            0x0000FF00,  # Green channel bitmask
-            0x000000FF,  # Blue channel bitmask
-            0xFF000000,  # Alpha channel bitmask
-            0x73524742,  # sRGB color space
-            4,  # LCS_GM_IMAGES
-        )
-
-        return hdr + enc
-
-    def _mix(self, x: "RGBA", y: "RGBA", a: float) -> "RGBA":
+    def _decode_bc1(self, w: int, h: int, data: bytes) -> bytearray:
         """
-        Linearly interpolate between x and y, returning x*(1-a) + y*a for all elements
-        """
-        assert len(x) == len(y)
-        return cast("RGBA", tuple(x[i] * (1 - a) + y[i] * (a) for i in range(len(x))))
-
-    def _unpack_r5g6b5(self, value: int) -> "RGBA":
-        """
-        Unpack a 16-bit (565) RGB as a real-value color tuple in the range of [0,1]
-        """
-        r = self._get_bits(value, 15, 11)
-        g = self._get_bits(value, 10, 5)
-        b = self._get_bits(value, 4, 0)
-        return (r / 31, g / 63, b / 31, 1)
-
-    def _get_bits(self, value: int, hi: int, lo: int) -> int:
-        """
-        Extract a bitrange from an integer
-        """
-        return (value & ((1 << (hi + 1)) - 1)) >> lo
-
-    def _decode_bc1(self, w: int, h: int, data: bytes) -> List["RGBA"]:
-        """
-        Decode a BC1 (aka DXT1) compressed image to a list of pixel real-value color
-        tuples
+        Decode a BC1 (aka DXT1) compressed image to 8-bit RGBA pixel bytes
 
         More information about BC1 can be found at: https://docs.microsoft.com/en-us/windows/win32/direct3d10/d3d10-graphics-programming-guide-resources-block-compression#bc1
         """  # noqa: E501, pylint:disable=line-too-long
@@ -271,59 +580,50 @@ class IconDownloader(QThread):
         num_blocks = blocks_per_row * blocks_per_col
         num_bytes = num_blocks * 8
         assert len(data) >= num_bytes
-        pixels: List[RGBA] = [(0.0, 0.0, 0.0, 0.0) for _ in range(w * h)]
-
-        # Decode blocks
-        for block_idx in range(num_blocks):
-            block_y = (block_idx // blocks_per_row) * 4
-            block_x = (block_idx % blocks_per_row) * 4
-            block_data = data[(block_idx * 8) : (block_idx * 8 + 8)]
-
-            c0_raw, c1_raw, indices = struct.unpack("<HHI", block_data[0:8])
-            alpha_enabled = c0_raw <= c1_raw
-            c0, c1 = self._unpack_r5g6b5(c0_raw), self._unpack_r5g6b5(c1_raw)
-
-            if alpha_enabled:
-                mixed = self._mix(c0, c1, 1 / 2)
-                mixed2 = (0.0, 0.0, 0.0, 0.0)
-            else:
-                mixed = self._mix(c0, c1, 1 / 3)
-                mixed2 = self._mix(c0, c1, 2 / 3)
-            colors = (c0, c1, mixed, mixed2)
-
-            for y in range(4):
-                for x in range(4):
-                    bit_off = y * 8 + x * 2
-                    color_idx = self._get_bits(indices, bit_off + 1, bit_off)
-                    addr = (block_y + y) * w + (block_x + x)
-                    pixels[addr] = colors[color_idx]
+        stride = w * 4
+        pixels = bytearray(stride * h)
+        row_indices = _BC_ROW_INDICES
+
+        # Decode blocks; every block is unpacked in one pass and each of its
+        # rows is written as a single 4-pixel slice
+        offsets = _bc_block_offsets(w, h)
+        blocks = struct.iter_unpack("<HHI", data[:num_bytes])
+        for offset, (c0_raw, c1_raw, indices) in zip(offsets, blocks):
+            colors = _bc_colors(c0_raw, c1_raw, c0_raw <= c1_raw)
+
+            for _ in range(4):
+                i0, i1, i2, i3 = row_indices[indices & 0xFF]
+                pixels[offset : offset + 16] = (
+                    colors[i0] + colors[i1] + colors[i2] + colors[i3]
+                )
+                indices >>= 8
+                offset += stride
 
         return pixels
 
-    def _xbx_to_bmp(self, xbx_data: bytes) -> bytes:
-        """Convert XBX image data to BMP format"""
+    def _xbx_to_image(self, xbx_data: bytes) -> QImage:
+        """Convert XBX image data to a QImage"""
+        decoders = {
+            0x30525058: self._decode_xpr_image,  # XPR0
+            0x20534444: self._decode_dds_image,  # DDS
+        }
         try:
             # Check if it's XPR or DDS format
             if len(xbx_data) >= 4:
-                magic = struct.unpack("<I", xbx_data[0:4])[0]
-                if magic == 0x30525058:  # XPR0
-                    w, h, pixels = self._decode_xpr_image(xbx_data)
-                elif magic == 0x20534444:  # DDS
-                    w, h, pixels = self._decode_dds_image(xbx_data)
-                else:
+                magic = int.from_bytes(xbx_data[:4], "little")
+                decode = decoders.get(magic)
+                if decode is None:
                     print(f"Unknown image format magic: 0x{magic:08X}")
                     raise ValueError(f"Unsupported image format: 0x{magic:08X}")
+                w, h, pixels = decode(xbx_data)
             else:
                 raise ValueError("Image data too small")
         except Exception as e:
             print(f"Error decoding image: {e}")
             raise
-        try:
-            bmp_data = self._encode_bmp(w, h, pixels)
-        except Exception as e:
-            print(f"Error encoding BMP image: {e}")
-            return bytes()
-        return bmp_data
+        # The decoders produce RGBA bytes, which Qt can wrap as they are; copy
+        # so the image owns its pixels once the buffer goes away
+        return QImage(pixels, w, h, w * 4, QImage.Format.Format_RGBA8888).copy()
 
     def _extract_icon_from_xbe(self, xbe_path: Path, expected_title_id: str) -> QPixmap:
         """Extract icon from XBE file using pyxbe Python API directly"""
@@ -334,32 +634,32 @@ class IconDownloader(QThread):
             if not xtimage_section:
                 print("[WARNING] XBE file does not contain $$XTIMAGE section")
                 return QPixmap()
-            # The section's data is the raw BMP image
+            # The section's data is the raw XBX image
             image_data = xtimage_section.data
             if not image_data:
                 print("[WARNING] No image data found in $$XTIMAGE section")
                 return QPixmap()
-            # Convert XBX to BMP
-            try:
-                image_data = self._xbx_to_bmp(image_data)
-            except Exception as e:
-                print(f"Error converting XBX to BMP: {e}")
-                return QPixmap()
-            # Load BMP data into QPixmap
-            pixmap = QPixmap()
-            if pixmap.loadFromData(image_data, "BMP"):
-                # Optionally cache as PNG
-                if not pixmap.isNull():
-                    cache_file = self.cache_dir / f"{expected_title_id}.png"
-                    pixmap.save(str(cache_file), "PNG")
-                return pixmap
-            else:
-                return QPixmap()
+            # Decode the XBX image, reusing an identical image seen this run
+            key = hashlib.blake2b(image_data, digest_size=16).digest()
+            image = self._converted_images.get(key)
+            if image is None:
+                try:
+                    image = self._xbx_to_image(image_data)
+                except Exception as e:
+                    print(f"Error decoding XBX image: {e}")
+                    return QPixmap()
+                self._converted_images[key] = image
+            pixmap = QPixmap.fromImage(image)
+            # Optionally cache as PNG
+            if not pixmap.isNull():
+                cache_file = self.cache_dir / f"{expected_title_id}.png"
+                pixmap.save(str(cache_file), "PNG", ICON_PNG_QUALITY)
+            return pixmap
         except Exception as e:
             print(f"Exception in XBE icon extraction: {e}")
             return QPixmap()
 
-    def _decode_xpr_image(self, data: bytes) -> Tuple[int, int, List["RGBA"]]:
+    def _decode_xpr_image(self, data: bytes) -> Tuple[int, int, bytes]:
         """
         Decode an XPR (Xbox Packed Resource) image
         """
@@ -380,158 +680,83 @@ class IconDownloader(QThread):
                 f"[WARNING] Size mismatch: header says {hdr.total_size}, actual {len(data)}"
             )
 
-        format_id = self._get_bits(hdr.format, 15, 8)
-        dimensionality = self._get_bits(hdr.format, 7, 4)
+        format_id = (hdr.format >> 8) & 0xFF
+        dimensionality = (hdr.format >> 4) & 0xF
 
         assert dimensionality == 2, f"Dimensionality is not 2D (got {dimensionality})"
 
-        w = 1 << self._get_bits(hdr.format, 23, 20)
-        h = 1 << self._get_bits(hdr.format, 27, 24)
+        w = 1 << ((hdr.format >> 20) & 0xF)
+        h = 1 << ((hdr.format >> 24) & 0xF)
 
         image_data = data[hdr.header_size :]
 
         # Decode based on format
-        if format_id == 0x0C:  # DXT1
-            pixels = self._decode_bc1(w, h, image_data)
-        elif format_id == 0x06:  # A8R8G8B8
-            pixels = self._decode_a8r8g8b8(w, h, image_data)
-        elif format_id == 0x07:  # X8R8G8B8
-            pixels = self._decode_x8r8g8b8(w, h, image_data)
-        elif format_id == 0x05:  # R5G6B5
-            pixels = self._decode_r5g6b5(w, h, image_data)
-        elif format_id == 0x02:  # A1R5G5B5
-            pixels = self._decode_a1r5g5b5(w, h, image_data)
-        elif format_id == 0x03:  # X1R5G5B5
-            pixels = self._decode_x1r5g5b5(w, h, image_data)
-        elif format_id == 0x04:  # A4R4G4B4
-            pixels = self._decode_a4r4g4b4(w, h, image_data)
-        elif format_id == 0x19:  # A8
-            pixels = self._decode_a8(w, h, image_data)
-        elif format_id == 0x3A:  # A8B8G8R8
-            pixels = self._decode_a8b8g8r8(w, h, image_data)
-        elif format_id == 0x0E:  # DXT3
-            pixels = self._decode_bc2(w, h, image_data)
-        elif format_id == 0x0F:  # DXT5
-            pixels = self._decode_bc3(w, h, image_data)
-        else:
+        decoder = self._XPR_DECODERS.get(format_id)
+        if decoder is None:
             raise NotImplementedError(f"Unsupported texture format: 0x{format_id:02X}")
+        pixels = decoder(self, w, h, image_data)
 
         return (w, h, pixels)
 
-    def _decode_a8r8g8b8(self, w: int, h: int, data: bytes) -> List["RGBA"]:
+    def _decode_a8r8g8b8(self, w: int, h: int, data: bytes) -> bytes:
         """Decode A8R8G8B8 format (32-bit ARGB)"""
         expected_size = w * h * 4
         assert len(data) >= expected_size, (
             f"Not enough data: expected {expected_size}, got {len(data)}"
         )
 
-        # First read the swizzled data into a temporary array
-        swizzled_pixels = []
-        for i in range(0, expected_size, 4):
-            if i + 3 < len(data):
-                b, g, r, a = struct.unpack("<BBBB", data[i : i + 4])
-                swizzled_pixels.append((r / 255.0, g / 255.0, b / 255.0, a / 255.0))
-
-        # Deswizzle to linear format
-        return self._deswizzle_pixels(swizzled_pixels, w, h)
+        # Swap to RGBA, then deswizzle to linear format
+        pixels = _bgra_to_rgba(data[:expected_size])
+        return self._deswizzle_pixels(pixels, w, h)
 
-    def _decode_x8r8g8b8(self, w: int, h: int, data: bytes) -> List["RGBA"]:
+    def _decode_x8r8g8b8(self, w: int, h: int, data: bytes) -> bytes:
         """Decode X8R8G8B8 format (32-bit RGB with unused alpha)"""
         expected_size = w * h * 4
         assert len(data) >= expected_size, (
             f"Not enough data: expected {expected_size}, got {len(data)}"
         )
 
-        # First read the swizzled data into a temporary array
-        swizzled_pixels = []
-        for i in range(0, expected_size, 4):
-            if i + 3 < len(data):
-                b, g, r, _ = struct.unpack("<BBBB", data[i : i + 4])
-                swizzled_pixels.append((r / 255.0, g / 255.0, b / 255.0, 1.0))
-
-        # Deswizzle to linear format
-        return self._deswizzle_pixels(swizzled_pixels, w, h)
+        # Swap to RGBA, then deswizzle to linear format
+        pixels = _bgra_to_rgba(data[:expected_size], opaque=True)
+        return self._deswizzle_pixels(pixels, w, h)
 
-    def _decode_r5g6b5(self, w: int, h: int, data: bytes) -> List["RGBA"]:
+    def _decode_r5g6b5(self, w: int, h: int, data: bytes) -> bytes:
         """Decode R5G6B5 format (16-bit RGB)"""
         expected_size = w * h * 2
         assert len(data) >= expected_size, (
             f"Not enough data: expected {expected_size}, got {len(data)}"
         )
 
-        swizzled_pixels = []
-        for i in range(0, expected_size, 2):
-            if i + 1 < len(data):
-                value = struct.unpack("<H", data[i : i + 2])[0]
-                swizzled_pixels.append(self._unpack_r5g6b5(value))
-
+        swizzled_pixels = _expand_16bit_pixels(data, w * h, _r5g6b5_table())
         return self._deswizzle_pixels(swizzled_pixels, w, h)
 
     def _deswizzle_pixels(
-        self, swizzled_pixels: List["RGBA"], width: int, height: int
-    ) -> List["RGBA"]:
+        self, swizzled_pixels: bytes, width: int, height: int
+    ) -> bytes:
         """
         Convert Xbox swizzled texture format to linear format
         Xbox uses a recursive Z-order (Morton order) swizzling pattern
         """
-        if not swizzled_pixels or len(swizzled_pixels) != width * height:
+        num_pixels = width * height
+        if num_pixels < 2 or len(swizzled_pixels) != num_pixels * 4:
             return swizzled_pixels
 
-        linear_pixels = [(0.0, 0.0, 0.0, 0.0)] * (width * height)
-
-        def swizzle_2d(x: int, y: int, width: int, height: int) -> int:
-            """Calculate swizzled index for given x,y coordinate"""
-            # Find the size of the smallest power-of-2 square that contains the image
-            max_dim = max(width, height)
-            log_size = 0
-            size = 1
-            while size < max_dim:
-                size <<= 1
-                log_size += 1
-
-            # Swizzle within that square
-            swizzled_idx = 0
-            for i in range(log_size):
-                bit = 1 << i
-                if x & bit:
-                    swizzled_idx |= bit << i
-                if y & bit:
-                    swizzled_idx |= bit << (i + 1)
-
-            return swizzled_idx
-
-        # Convert from swizzled to linear
-        for y in range(height):
-            for x in range(width):
-                swizzled_idx = swizzle_2d(x, y, width, height)
-                linear_idx = y * width + x
-
-                # Bounds check to prevent crashes
-                if swizzled_idx < len(swizzled_pixels):
-                    linear_pixels[linear_idx] = swizzled_pixels[swizzled_idx]
-
-        return linear_pixels
-
-    def _decode_a1r5g5b5(self, w: int, h: int, data: bytes) -> List["RGBA"]:
+        # Move whole 32-bit pixels; the extra zero pixel at the end stands in
+        # for swizzled positions outside the source
+        source = array("I", swizzled_pixels)
+        source.append(0)
+        return array("I", _deswizzle_gather(width, height)(source)).tobytes()
+
+    def _decode_a1r5g5b5(self, w: int, h: int, data: bytes) -> bytes:
         """Decode A1R5G5B5 format (16-bit ARGB with 1-bit alpha)"""
-        pixels: List[RGBA] = []
         expected_size = w * h * 2
         assert len(data) >= expected_size, (
             f"Not enough data: expected {expected_size}, got {len(data)}"
         )
 
-        for i in range(0, len(data), 2):
-            if i + 1 < len(data):
-                value = struct.unpack("<H", data[i : i + 2])[0]
-                a = self._get_bits(value, 15, 15)
-                r = self._get_bits(value, 14, 10)
-                g = self._get_bits(value, 9, 5)
-                b = self._get_bits(value, 4, 0)
-                pixels.append((r / 31.0, g / 31.0, b / 31.0, float(a)))
-
-        return pixels
+        return _expand_16bit_pixels(data, w * h, _a1r5g5b5_table(False))
 
-    def _decode_dds_image(self, data: bytes) -> Tuple[int, int, List["RGBA"]]:
+    def _decode_dds_image(self, data: bytes) -> Tuple[int, int, bytes]:
         """
         Decode a DDS (DirectDraw Surface) image
         """
@@ -540,43 +765,26 @@ class IconDownloader(QThread):
         if len(data) < 128:
             raise ValueError("DDS data too small for header")
 
-        # Parse basic DDS header fields we need
-        magic = struct.unpack("<I", data[0:4])[0]
+        (
+            magic,
+            height,
+            width,
+            pf_fourcc,
+            pf_rgb_bit_count,
+            pf_r_bit_mask,
+            pf_g_bit_mask,
+            pf_b_bit_mask,
+            pf_a_bit_mask,
+        ) = _DDS_HEADER.unpack_from(data)
         assert magic == 0x20534444, f"Invalid DDS magic: 0x{magic:08X}"
 
-        # DDS_HEADER structure (starting at offset 4)
-        # size = struct.unpack("<I", data[4:8])[0]  # Should be 124
-        # flags = struct.unpack("<I", data[8:12])[0]
-        height = struct.unpack("<I", data[12:16])[0]
-        width = struct.unpack("<I", data[16:20])[0]
-        # pitch_or_linear_size = struct.unpack("<I", data[20:24])[0]
-        # depth = struct.unpack("<I", data[24:28])[0]
-        # mip_map_count = struct.unpack("<I", data[28:32])[0]
-
-        # Skip reserved fields (44 bytes from offset 32-75)
-
-        # DDS_PIXELFORMAT structure (32 bytes starting at offset 76)
-        # pf_size = struct.unpack("<I", data[76:80])[0]  # Should be 32
-        # pf_flags = struct.unpack("<I", data[80:84])[0]
-        pf_fourcc = struct.unpack("<I", data[84:88])[0]
-        pf_rgb_bit_count = struct.unpack("<I", data[88:92])[0]
-        pf_r_bit_mask = struct.unpack("<I", data[92:96])[0]
-        pf_g_bit_mask = struct.unpack("<I", data[96:100])[0]
-        pf_b_bit_mask = struct.unpack("<I", data[100:104])[0]
-        pf_a_bit_mask = struct.unpack("<I", data[104:108])[0]
-
-        # Skip caps and reserved fields (20 bytes from offset 108-127)
-
         # Image data starts after header
         image_data = data[128:]
 
         # Determine format and decode
-        if pf_fourcc == 0x31545844:  # 'DXT1'
-            pixels = self._decode_bc1(width, height, image_data)
-        elif pf_fourcc == 0x33545844:  # 'DXT3'
-            pixels = self._decode_bc2(width, height, image_data)
-        elif pf_fourcc == 0x35545844:  # 'DXT5'
-            pixels = self._decode_bc3(width, height, image_data)
+        decoder = self._DDS_FOURCC_DECODERS.get(pf_fourcc)
+        if decoder is not None:
+            pixels = decoder(self, width, height, image_data)
         elif pf_fourcc == 0:  # Uncompressed format
             if pf_rgb_bit_count == 32:
                 # Determine format based on bit masks
@@ -624,118 +832,75 @@ class IconDownloader(QThread):
 
         return (width, height, pixels)
 
-    def _decode_dds_a8r8g8b8(self, w: int, h: int, data: bytes) -> List["RGBA"]:
+    def _decode_dds_a8r8g8b8(self, w: int, h: int, data: bytes) -> bytearray:
         """Decode DDS A8R8G8B8 format (32-bit ARGB) - linear format, no swizzling"""
         expected_size = w * h * 4
         assert len(data) >= expected_size, (
             f"Not enough data: expected {expected_size}, got {len(data)}"
         )
 
-        pixels = []
-        for i in range(0, expected_size, 4):
-            if i + 3 < len(data):
-                b, g, r, a = struct.unpack("<BBBB", data[i : i + 4])
-                pixels.append((r / 255.0, g / 255.0, b / 255.0, a / 255.0))
+        return _bgra_to_rgba(data[:expected_size])
 
-        return pixels
-
-    def _decode_dds_x8r8g8b8(self, w: int, h: int, data: bytes) -> List["RGBA"]:
+    def _decode_dds_x8r8g8b8(self, w: int, h: int, data: bytes) -> bytearray:
         """Decode DDS X8R8G8B8 format (32-bit RGB) - linear format, no swizzling"""
         expected_size = w * h * 4
         assert len(data) >= expected_size, (
             f"Not enough data: expected {expected_size}, got {len(data)}"
         )
 
-        pixels = []
-        for i in range(0, expected_size, 4):
-            if i + 3 < len(data):
-                b, g, r, _ = struct.unpack("<BBBB", data[i : i + 4])
-                pixels.append((r / 255.0, g / 255.0, b / 255.0, 1.0))
-
-        return pixels
+        return _bgra_to_rgba(data[:expected_size], opaque=True)
 
-    def _decode_dds_r5g6b5(self, w: int, h: int, data: bytes) -> List["RGBA"]:
+    def _decode_dds_r5g6b5(self, w: int, h: int, data: bytes) -> bytes:
         """Decode DDS R5G6B5 format (16-bit RGB) - linear format, no swizzling"""
         expected_size = w * h * 2
         assert len(data) >= expected_size, (
             f"Not enough data: expected {expected_size}, got {len(data)}"
         )
 
-        pixels = []
-        for i in range(0, expected_size, 2):
-            if i + 1 < len(data):
-                value = struct.unpack("<H", data[i : i + 2])[0]
-                pixels.append(self._unpack_r5g6b5(value))
+        return _expand_16bit_pixels(data, w * h, _r5g6b5_table())
 
-        return pixels
-
-    def _decode_x1r5g5b5(self, w: int, h: int, data: bytes) -> List["RGBA"]:
+    def _decode_x1r5g5b5(self, w: int, h: int, data: bytes) -> bytes:
         """Decode X1R5G5B5 format (16-bit RGB with unused bit)"""
-        pixels: List[RGBA] = []
         expected_size = w * h * 2
         assert len(data) >= expected_size, (
             f"Not enough data: expected {expected_size}, got {len(data)}"
         )
 
-        for i in range(0, len(data), 2):
-            if i + 1 < len(data):
-                value = struct.unpack("<H", data[i : i + 2])[0]
-                r = self._get_bits(value, 14, 10)
-                g = self._get_bits(value, 9, 5)
-                b = self._get_bits(value, 4, 0)
-                pixels.append((r / 31.0, g / 31.0, b / 31.0, 1.0))
-
-        return pixels
+        return _expand_16bit_pixels(data, w * h, _a1r5g5b5_table(True))
 
-    def _decode_a4r4g4b4(self, w: int, h: int, data: bytes) -> List["RGBA"]:
+    def _decode_a4r4g4b4(self, w: int, h: int, data: bytes) -> bytes:
         """Decode A4R4G4B4 format (16-bit ARGB with 4 bits per channel)"""
-        pixels: List[RGBA] = []
         expected_size = w * h * 2
         assert len(data) >= expected_size, (
             f"Not enough data: expected {expected_size}, got {len(data)}"
         )
 
-        for i in range(0, len(data), 2):
-            if i + 1 < len(data):
-                value = struct.unpack("<H", data[i : i + 2])[0]
-                a = self._get_bits(value, 15, 12)
-                r = self._get_bits(value, 11, 8)
-                g = self._get_bits(value, 7, 4)
-                b = self._get_bits(value, 3, 0)
-                pixels.append((r / 15.0, g / 15.0, b / 15.0, a / 15.0))
+        return _expand_16bit_pixels(data, w * h, _a4r4g4b4_table())
 
-        return pixels
-
-    def _decode_a8(self, w: int, h: int, data: bytes) -> List["RGBA"]:
+    def _decode_a8(self, w: int, h: int, data: bytes) -> bytearray:
         """Decode A8 format (8-bit alpha only)"""
-        pixels: List[RGBA] = []
         expected_size = w * h
         assert len(data) >= expected_size, (
             f"Not enough data: expected {expected_size}, got {len(data)}"
         )
 
-        for i in range(len(data)):
-            a = data[i] / 255.0
-            pixels.append((1.0, 1.0, 1.0, a))  # White with varying alpha
+        # White with varying alpha
+        pixels = bytearray(b"\xff" * (expected_size * 4))
+        pixels[3::4] = data[:expected_size]
 
         return pixels
 
-    def _decode_a8b8g8r8(self, w: int, h: int, data: bytes) -> List["RGBA"]:
+    def _decode_a8b8g8r8(self, w: int, h: int, data: bytes) -> bytes:
         """Decode A8B8G8R8 format (32-bit ABGR)"""
         expected_size = w * h * 4
         assert len(data) >= expected_size, (
             f"Not enough data: expected {expected_size}, got {len(data)}"
         )
 
-        swizzled_pixels = []
-        for i in range(0, expected_size, 4):
-            if i + 3 < len(data):
-                r, g, b, a = struct.unpack("<BBBB", data[i : i + 4])
-                swizzled_pixels.append((r / 255.0, g / 255.0, b / 255.0, a / 255.0))
-
-        return self._deswizzle_pixels(swizzled_pixels, w, h)
+        # Little-endian ABGR is already RGBA byte order
+        return self._deswizzle_pixels(data[:expected_size], w, h)
 
-    def _decode_bc2(self, w: int, h: int, data: bytes) -> List["RGBA"]:
+    def _decode_bc2(self, w: int, h: int, data: bytes) -> bytearray:
         """
         Decode BC2 (DXT3) compressed image
         Similar to BC1 but with explicit 4-bit alpha
@@ -747,47 +912,49 @@ class IconDownloader(QThread):
         num_blocks = blocks_per_row * blocks_per_col
         num_bytes = num_blocks * 16  # 16 bytes per block for DXT3
         assert len(data) >= num_bytes
-        pixels: List[RGBA] = [(0.0, 0.0, 0.0, 0.0) for _ in range(w * h)]
-
-        for block_idx in range(num_blocks):
-            block_y = (block_idx // blocks_per_row) * 4
-            block_x = (block_idx % blocks_per_row) * 4
-            block_data = data[(block_idx * 16) : (block_idx * 16 + 16)]
-
-            # First 8 bytes: alpha data (4 bits per pixel)
-            alpha_data = struct.unpack("<Q", block_data[0:8])[0]
-
-            # Next 8 bytes: color data (same as DXT1)
-            c0_raw, c1_raw, color_indices = struct.unpack("<HHI", block_data[8:16])
-            c0, c1 = self._unpack_r5g6b5(c0_raw), self._unpack_r5g6b5(c1_raw)
-
+        stride = w * 4
+        pixels = bytearray(stride * h)
+        row_indices = _BC_ROW_INDICES
+
+        # Each block is 8 bytes of alpha data (4 bits per pixel) followed by
+        # color data laid out as in DXT1. Color rows are written as in BC1
+        offsets = _bc_block_offsets(w, h)
+        blocks = struct.iter_unpack("<8xHHI", data[:num_bytes])
+        for offset, (c0_raw, c1_raw, indices) in zip(offsets, blocks):
             # Always use 4-color mode for DXT3
-            mixed1 = self._mix(c0, c1, 1 / 3)
-            mixed2 = self._mix(c0, c1, 2 / 3)
-            colors = (c0, c1, mixed1, mixed2)
-
-            for y in range(4):
-                for x in range(4):
-                    # Extract alpha (4 bits per pixel)
-                    alpha_bit_off = (y * 4 + x) * 4
-                    alpha = (
-                        self._get_bits(alpha_data, alpha_bit_off + 3, alpha_bit_off)
-                        / 15.0
-                    )
-
-                    # Extract color index (2 bits per pixel)
-                    color_bit_off = y * 8 + x * 2
-                    color_idx = self._get_bits(
-                        color_indices, color_bit_off + 1, color_bit_off
-                    )
+            colors = _bc_colors(c0_raw, c1_raw, False)
 
-                    r, g, b, _ = colors[color_idx]
-                    addr = (block_y + y) * w + (block_x + x)
-                    pixels[addr] = (r, g, b, alpha)
+            for _ in range(4):
+                i0, i1, i2, i3 = row_indices[indices & 0xFF]
+                pixels[offset : offset + 16] = (
+                    colors[i0] + colors[i1] + colors[i2] + colors[i3]
+                )
+                indices >>= 8
+                offset += stride
+
+        # Then the alpha bytes are overwritten for every block at once. Alpha
+        # byte k of a block holds pixels 2k and 2k+1 (row k // 2); taking
+        # that byte from all blocks and expanding either nibble gives one
+        # pixel position's alpha for each block, which lands 16 bytes apart
+        # within a block row
+        row_span = blocks_per_row * 16
+        for k in range(8):
+            column = data[k:num_bytes:16]
+            y, x = divmod(2 * k, 4)
+            for nibbles, pixel_x in (
+                (column.translate(_BC2_ALPHA_LOW), x),
+                (column.translate(_BC2_ALPHA_HIGH), x + 1),
+            ):
+                for block_y in range(blocks_per_col):
+                    start = (block_y * 4 + y) * stride + pixel_x * 4 + 3
+                    first = block_y * blocks_per_row
+                    pixels[start : start + row_span : 16] = nibbles[
+                        first : first + blocks_per_row
+                    ]
 
         return pixels
 
-    def _decode_bc3(self, w: int, h: int, data: bytes) -> List["RGBA"]:
+    def _decode_bc3(self, w: int, h: int, data: bytes) -> bytearray:
         """
         Decode BC3 (DXT5) compressed image
         Similar to BC1 but with interpolated alpha
@@ -799,73 +966,60 @@ class IconDownloader(QThread):
         num_blocks = blocks_per_row * blocks_per_col
         num_bytes = num_blocks * 16  # 16 bytes per block for DXT5
         assert len(data) >= num_bytes
-        pixels: List[RGBA] = [(0.0, 0.0, 0.0, 0.0) for _ in range(w * h)]
-
-        for block_idx in range(num_blocks):
-            block_y = (block_idx // blocks_per_row) * 4
-            block_x = (block_idx % blocks_per_row) * 4
-            block_data = data[(block_idx * 16) : (block_idx * 16 + 16)]
-
-            # First 8 bytes: alpha data
-            a0, a1 = struct.unpack("<BB", block_data[0:2])
-            alpha_indices = (
-                struct.unpack("<Q", block_data[0:8])[0] >> 16
-            )  # Skip first 2 bytes
-
-            # Generate alpha palette
-            if a0 > a1:
-                alphas = [
-                    a0 / 255,
-                    a1 / 255,
-                    (6 * a0 + 1 * a1) / 7 / 255,
-                    (5 * a0 + 2 * a1) / 7 / 255,
-                    (4 * a0 + 3 * a1) / 7 / 255,
-                    (3 * a0 + 4 * a1) / 7 / 255,
-                    (2 * a0 + 5 * a1) / 7 / 255,
-                    (1 * a0 + 6 * a1) / 7 / 255,
-                ]
-            else:
-                alphas = [
-                    a0 / 255,
-                    a1 / 255,
-                    (4 * a0 + 1 * a1) / 5 / 255,
-                    (3 * a0 + 2 * a1) / 5 / 255,
-                    (2 * a0 + 3 * a1) / 5 / 255,
-                    (1 * a0 + 4 * a1) / 5 / 255,
-                    0.0,
-                    1.0,
-                ]
-
-            # Next 8 bytes: color data (same as DXT1)
-            c0_raw, c1_raw, color_indices = struct.unpack("<HHI", block_data[8:16])
-            c0, c1 = self._unpack_r5g6b5(c0_raw), self._unpack_r5g6b5(c1_raw)
+        stride = w * 4
+        pixels = bytearray(stride * h)
+        row_indices = _BC_ROW_INDICES
+        alpha_rows = _BC3_ALPHA_ROWS
+
+        # Each block is 8 bytes of alpha data (two endpoints and 3-bit
+        # indices) followed by color data laid out as in DXT1. Rows are
+        # written as in BC1, then their alpha bytes are overwritten through
+        # a strided slice
+        offsets = _bc_block_offsets(w, h)
+        blocks = struct.iter_unpack("<QHHI", data[:num_bytes])
+        for offset, (alpha_data, c0_raw, c1_raw, indices) in zip(offsets, blocks):
+            alphas = _bc3_alphas(alpha_data & 0xFFFF)
+            alpha_indices = alpha_data >> 16  # Skip the two endpoint bytes
 
             # Always use 4-color mode for DXT5
-            mixed1 = self._mix(c0, c1, 1 / 3)
-            mixed2 = self._mix(c0, c1, 2 / 3)
-            colors = (c0, c1, mixed1, mixed2)
-
-            for y in range(4):
-                for x in range(4):
-                    # Extract alpha index (3 bits per pixel)
-                    alpha_bit_off = (y * 4 + x) * 3
-                    alpha_idx = self._get_bits(
-                        alpha_indices, alpha_bit_off + 2, alpha_bit_off
-                    )
-                    alpha = alphas[alpha_idx]
-
-                    # Extract color index (2 bits per pixel)
-                    color_bit_off = y * 8 + x * 2
-                    color_idx = self._get_bits(
-                        color_indices, color_bit_off + 1, color_bit_off
-                    )
+            colors = _bc_colors(c0_raw, c1_raw, False)
 
-                    r, g, b, _ = colors[color_idx]
-                    addr = (block_y + y) * w + (block_x + x)
-                    pixels[addr] = (r, g, b, alpha)
+            for _ in range(4):
+                i0, i1, i2, i3 = row_indices[indices & 0xFF]
+                pixels[offset : offset + 16] = (
+                    colors[i0] + colors[i1] + colors[i2] + colors[i3]
+                )
+                pixels[offset + 3 : offset + 16 : 4] = bytes(
+                    alpha_rows[alpha_indices & 0xFFF](alphas)
+                )
+                indices >>= 8
+                alpha_indices >>= 12
+                offset += stride
 
         return pixels
 
+    # Texture decoders by XPR format ID
+    _XPR_DECODERS = {
+        0x0C: _decode_bc1,  # DXT1
+        0x06: _decode_a8r8g8b8,
+        0x07: _decode_x8r8g8b8,
+        0x05: _decode_r5g6b5,
+        0x02: _decode_a1r5g5b5,
+        0x03: _decode_x1r5g5b5,
+        0x04: _decode_a4r4g4b4,
+        0x19: _decode_a8,
+        0x3A: _decode_a8b8g8r8,
+        0x0E: _decode_bc2,  # DXT3
+        0x0F: _decode_bc3,  # DXT5
+    }
+
+    # Block-compressed DDS decoders by pixel format fourcc
+    _DDS_FOURCC_DECODERS = {
+        0x31545844: _decode_bc1,  # 'DXT1'
+        0x33545844: _decode_bc2,  # 'DXT3'
+        0x35545844: _decode_bc3,  # 'DXT5'
+    }
+
 
 class XprImageHeader(ctypes.LittleEndianStructure, StructurePrintMixin):
     """
@@ -2,6 +2,8 @@
 Worker for installing a single DLC in the background
 """
 
+import time
+
 from PyQt6.QtCore import QThread, pyqtSignal
 
 
@@ -12,6 +14,9 @@ class SingleDLCInstaller(QThread):
     progress = pyqtSignal(int, int)  # current_bytes, total_bytes
     finished = pyqtSignal(bool, str)  # success, error_message
 
+    # Minimum interval in seconds between progress emissions (~20Hz)
+    PROGRESS_INTERVAL = 0.05
+
     def __init__(
         self,
         dlc_utils,
@@ -40,10 +45,28 @@ class SingleDLCInstaller(QThread):
                 self.finished.emit(False, "Cancelled")
                 return
 
-            # Create progress callback that emits signals with bytes transferred
+            # Create progress callback that emits signals with bytes transferred.
+            # The installers report every chunk, so only a change of whole
+            # percent at most every PROGRESS_INTERVAL reaches the UI, plus
+            # the final total
+            last_percent = -1
+            last_time = 0.0
+
             def progress_callback(current_bytes, total_bytes):
-                if not self._should_stop:
+                nonlocal last_percent, last_time
+                if self._should_stop:
+                    return
+
+                done = current_bytes >= total_bytes
+                percent = current_bytes * 100 // total_bytes if total_bytes else 0
+                if percent == last_percent and not done:
+                    return
+
+                now = time.monotonic()
+                if done or now - last_time >= self.PROGRESS_INTERVAL:
                     self.progress.emit(current_bytes, total_bytes)
+                    last_percent = percent
+                    last_time = now
 
             # Install DLC
             if self.mode == "ftp":
@@ -1,8 +1,16 @@
 import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from utils.xboxunity import XboxUnity
 
+# Title updates downloaded at once; enough to overlap round-trips without
+# hammering XboxUnity
+TITLE_UPDATE_DOWNLOAD_WORKERS = 4
+
 
 class TitleUpdateDownloadWorker(QThread):
     """Worker thread for downloading title updates in the background"""
@@ -14,10 +22,21 @@ class TitleUpdateDownloadWorker(QThread):
     )  # title_update_name, success, filename, local_path
     download_error = pyqtSignal(str, str)  # title_update_name, error_message
 
+    # Minimum interval in seconds between progress emissions per download
+    PROGRESS_INTERVAL = 0.1
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.xbox_unity = XboxUnity()
-        self.downloads = []  # List of downloads to process
+        # Downloads to process; the dialog appends while run() pops, and
+        # both ends of a deque are atomic
+        self.downloads = deque()
+        # Last emitted (percentage, time) of each download in flight
+        self._last_progress = {}
+        # An entry appended after run() last found the queue empty, but
+        # before the thread finished, saw isRunning() still True and was
+        # never started; pick it up once the thread is done
+        self.finished.connect(self._restart_if_queued)
 
     def add_download(self, title_update_name: str, url: str, destination: str):
         """Add a download to the queue"""
@@ -26,12 +45,23 @@ class TitleUpdateDownloadWorker(QThread):
         )
 
     def run(self):
-        """Process all downloads in the queue"""
-        for download in self.downloads:
-            self._download_single_update(download)
+        """Process all downloads in the queue, several at a time"""
+        with ThreadPoolExecutor(max_workers=TITLE_UPDATE_DOWNLOAD_WORKERS) as executor:
+            pending = set()
+            while True:
+                # Downloads queued while earlier ones are in flight are
+                # picked up here as well
+                while self.downloads:
+                    download = self.downloads.popleft()
+                    pending.add(executor.submit(self._download_single_update, download))
+                if not pending:
+                    break
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
 
-        # Clear the queue after processing
-        self.downloads.clear()
+    def _restart_if_queued(self):
+        """Run again for downloads queued while the last run was finishing"""
+        if self.downloads:
+            self.start()
 
     def _download_single_update(self, download):
         """Download a single title update"""
@@ -57,9 +87,21 @@ class TitleUpdateDownloadWorker(QThread):
 
         except Exception as e:
             self.download_error.emit(name, str(e))
+        finally:
+            self._last_progress.pop(name, None)
 
     def _progress_callback(self, name: str, downloaded: int, total: int):
-        """Handle download progress updates"""
-        if total > 0:
-            percentage = int((downloaded / total) * 100)
+        """Emit download progress on a percentage change, at most every
+        PROGRESS_INTERVAL"""
+        if total <= 0:
+            return
+
+        percentage = downloaded * 100 // total
+        last_percentage, last_time = self._last_progress.get(name, (-1, 0.0))
+        if percentage == last_percentage:
+            return
+
+        now = time.monotonic()
+        if percentage >= 100 or now - last_time >= self.PROGRESS_INTERVAL:
             self.download_progress.emit(name, percentage)
+            self._last_progress[name] = (percentage, now)
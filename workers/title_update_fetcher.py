@@ -1,7 +1,19 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from utils.xboxunity import XboxUnity
 
+# A game's media ID and its title update list are remembered for this long
+# (seconds), so reopening the same game skips the disk read and the request
+TITLE_UPDATE_CACHE_TTL = 60 * 60
+TITLE_UPDATE_CACHE_DIR = Path("cache/title_updates")
+
 
 class TitleUpdateFetchWorker(QThread):
     """Worker thread for fetching title updates from XboxUnity API in the background"""
@@ -21,6 +33,13 @@ class TitleUpdateFetchWorker(QThread):
     def run(self):
         """Fetch media ID and title updates from XboxUnity API"""
         try:
+            cached = self._load_cached_updates()
+            if cached:
+                media_id, updates = cached
+                self.media_id_fetched.emit(media_id)
+                self.fetch_complete.emit(media_id, updates)
+                return
+
             # Get media ID (reads from disk)
             self.status_update.emit("Reading game data from disk...")
             media_id = self.xbox_unity.get_media_id(self.folder_path)
@@ -45,8 +64,56 @@ class TitleUpdateFetchWorker(QThread):
                 )
                 return
 
+            self._save_cached_updates(media_id, updates)
+
             # Emit success with updates
             self.fetch_complete.emit(media_id, updates)
 
         except Exception as e:
             self.fetch_error.emit(f"Error fetching title updates: {str(e)}")
+
+    def _cache_file(self) -> Path:
+        """Cache file for this game folder and title ID"""
+        key = hashlib.blake2b(
+            f"{self.folder_path}\0{self.title_id}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+        return TITLE_UPDATE_CACHE_DIR / f"{key}.json"
+
+    def _load_cached_updates(self) -> Optional[Tuple[str, List]]:
+        """Load a recent media ID and update list, if there is one"""
+        try:
+            with open(self._cache_file(), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict):
+            return None
+
+        fetched_at = entry.get("fetched_at", 0)
+        if not isinstance(fetched_at, (int, float)):
+            return None
+        if time.time() - fetched_at >= TITLE_UPDATE_CACHE_TTL:
+            return None
+
+        media_id = entry.get("media_id")
+        updates = entry.get("updates")
+        if not media_id or not isinstance(updates, list) or not updates:
+            return None
+        return media_id, updates
+
+    def _save_cached_updates(self, media_id: str, updates: List):
+        """Remember a fetched media ID and update list
+
+        The file is written through a temporary file and renamed into place,
+        so a reader never sees a partial entry.
+        """
+        cache_file = self._cache_file()
+        temp_file = cache_file.with_name(f"{cache_file.name}.tmp")
+        entry = {"media_id": media_id, "updates": updates, "fetched_at": time.time()}
+        try:
+            TITLE_UPDATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(temp_file, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error caching title updates: {e}")
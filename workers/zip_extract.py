@@ -1,11 +1,29 @@
 import os
+import shutil
 import tempfile
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
+# Entries are streamed out of the archive in chunks this large; the default
+# copy buffer turns a multi-GB ISO into tens of thousands of read/write calls
+EXTRACT_CHUNK_SIZE = 1024 * 1024
+
+# Members above this size get their full length reserved on disk before
+# they are written, where the platform supports it
+PREALLOCATE_MIN_SIZE = 64 * 1024 * 1024
+
+# Failed members listed by name in an extraction error; the rest are counted
+MAX_REPORTED_FAILURES = 10
+
+# Threads extracting members at once; past a few, the disk is the bottleneck
+ZIP_EXTRACT_WORKERS = min(4, os.cpu_count() or 1)
+
 
 class ZipExtractorWorker(QThread):
     """Worker thread for extracting ZIP files with progress reporting"""
@@ -16,92 +34,120 @@ class ZipExtractorWorker(QThread):
     extraction_error = pyqtSignal(str)  # Error message
     file_extracted = pyqtSignal(str)  # Individual file extracted
 
+    # Minimum interval in seconds between progress emissions (~20Hz)
+    PROGRESS_INTERVAL = 0.05
+
     def __init__(self, zip_path: str, extract_to: Optional[str] = None):
         super().__init__()
         self.zip_path = zip_path
         self.extract_to = extract_to or str(
             Path(tempfile.gettempdir()) / "xbbm_zip_extract"
         )
+        # Prefix of every output path, so members are placed by concatenation
+        self._extract_base = os.path.join(self.extract_to, "")
         self.should_stop = False
+        self._last_progress_percent = -1
+        self._last_progress_time = 0.0
+        # Per-thread ZipFile handles opened by the extraction pool
+        self._local = threading.local()
+        self._handles: List[zipfile.ZipFile] = []
+        self._handles_lock = threading.Lock()
 
     def run(self):
         """Extract the ZIP file with progress reporting using optimized I/O"""
         try:
+            # A plain ISO handed over in place of an archive is already what
+            # the caller wants; is_zipfile only reads the end of the file.
+            # The path emitted is then zip_path itself, which callers must
+            # not clean up as an extracted temp file
+            if self.zip_path.lower().endswith(".iso") and not zipfile.is_zipfile(
+                self.zip_path
+            ):
+                self.progress.emit(100)
+                self.extraction_complete.emit(self.zip_path)
+                return
+
             # Ensure extraction directory exists
             os.makedirs(self.extract_to, exist_ok=True)
 
             with zipfile.ZipFile(self.zip_path, "r") as zip_ref:
                 file_list = zip_ref.infolist()
-                total_files = len(file_list)
+            if not file_list:
+                self.extraction_error.emit("ZIP file is empty")
+                return
 
-                if total_files == 0:
-                    self.extraction_error.emit("ZIP file is empty")
-                    return
+            # Only the ISO is used when the archive has one, so the readmes,
+            # NFOs and previews packed alongside it aren't written out
+            iso_entries = [
+                file_info
+                for file_info in file_list
+                if file_info.filename.lower().endswith(".iso")
+            ]
+            if iso_entries:
+                file_list = iso_entries
+            total_files = len(file_list)
 
-                extracted_files = []
-
-                # Use extractall for better performance on large archives
-                if total_files > 100:  # For large archives, use extractall
-                    try:
-                        zip_ref.extractall(self.extract_to)
+            # Every directory is created once up front rather than with a
+            # makedirs per member on the extraction threads
+            out_paths = [self._output_path(file_info) for file_info in file_list]
+            directories = {
+                out_path if file_info.is_dir() else os.path.dirname(out_path)
+                for file_info, out_path in zip(file_list, out_paths)
+            }
+            for directory in sorted(directories):
+                os.makedirs(directory, exist_ok=True)
 
-                        # Emit progress in chunks for large extractions
-                        for i in range(0, 101, 10):  # Progress every 10%
-                            if self.should_stop:
-                                break
-                            self.progress.emit(i)
-                            # Small delay to allow UI updates
-                            self.msleep(50)
+            extracted_files = []
+            # Members that failed, by name; one bad entry doesn't stop the rest
+            failures: Dict[str, str] = {}
 
-                        if not self.should_stop:
-                            self.progress.emit(100)
+            # Members are inflated in parallel (zlib releases the GIL while it
+            # works); each thread reads through its own ZipFile handle since
+            # a shared one would serialize every read on its file position
+            executor = ThreadPoolExecutor(max_workers=ZIP_EXTRACT_WORKERS)
+            try:
+                futures = {
+                    executor.submit(self._extract_entry, file_info, out_path): file_info
+                    for file_info, out_path in zip(file_list, out_paths)
+                }
+                for i, future in enumerate(as_completed(futures)):
+                    if self.should_stop:
+                        break
 
+                    file_info = futures[future]
+                    try:
+                        extracted_path = future.result()
                     except Exception as e:
-                        self.extraction_error.emit(
-                            f"Failed to extract archive: {str(e)}"
-                        )
-                        return
-
-                else:  # For smaller archives, extract individually with progress
-                    for i, file_info in enumerate(file_list):
-                        if self.should_stop:
-                            break
-
-                        try:
-                            # Extract individual file
-                            zip_ref.extract(file_info, self.extract_to)
-                            extracted_path = os.path.join(
-                                self.extract_to, file_info.filename
-                            )
-                            extracted_files.append(extracted_path)
-
-                            # Emit signals
-                            self.file_extracted.emit(file_info.filename)
-
-                            # Calculate and emit progress
-                            progress = int(((i + 1) / total_files) * 100)
-                            self.progress.emit(progress)
-
-                        except Exception as e:
-                            self.extraction_error.emit(
-                                f"Failed to extract {file_info.filename}: {str(e)}"
-                            )
-                            return
-
-                if not self.should_stop:
-                    # Look for ISO files in extracted content
-                    iso_files = []
-                    for root, dirs, files in os.walk(self.extract_to):
-                        for file in files:
-                            if file.lower().endswith(".iso"):
-                                iso_files.append(os.path.join(root, file))
-
-                    if iso_files:
-                        # Return the first ISO file found
-                        self.extraction_complete.emit(iso_files[0])
+                        failures[file_info.filename] = str(e)
                     else:
-                        # No ISO found, return the extraction directory
-                        self.extraction_complete.emit(self.extract_to)
+                        if extracted_path is None:
+                            continue
+                        extracted_files.append(extracted_path)
+
+                    # Calculate and emit progress
+                    progress = int(((i + 1) / total_files) * 100)
+                    self._emit_progress(progress, file_info.filename)
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+                self._close_handles()
+
+            if not self.should_stop:
+                # Where the ISO landed is known from the central directory, so
+                # the extracted tree doesn't need to be walked to find it
+                extracted_isos = [
+                    file_info
+                    for file_info in iso_entries
+                    if file_info.filename not in failures
+                ]
+                if extracted_isos:
+                    # Return the first ISO in the archive
+                    self.extraction_complete.emit(self._output_path(extracted_isos[0]))
+                elif failures and (iso_entries or not extracted_files):
+                    # Nothing usable came out; report every failure at once
+                    self.extraction_error.emit(self._failure_message(failures))
+                else:
+                    # No ISO found, return the extraction directory
+                    self.extraction_complete.emit(self.extract_to)
 
         except zipfile.BadZipFile:
             self.extraction_error.emit("Invalid or corrupted ZIP file")
@@ -112,6 +158,122 @@ class ZipExtractorWorker(QThread):
         except Exception as e:
             self.extraction_error.emit(f"Extraction failed: {str(e)}")
 
+    def _failure_message(self, failures: Dict[str, str]) -> str:
+        """Summarize the members that failed to extract in one message"""
+        lines = [
+            f"Failed to extract {filename}: {error}"
+            for filename, error in list(failures.items())[:MAX_REPORTED_FAILURES]
+        ]
+        if len(failures) > MAX_REPORTED_FAILURES:
+            lines.append(f"...and {len(failures) - MAX_REPORTED_FAILURES} more")
+        return "\n".join(lines)
+
+    def _emit_progress(self, percent: int, filename: str):
+        """Emit progress and file_extracted on a percentage change, at most
+        every PROGRESS_INTERVAL
+
+        Archives can hold thousands of small members; one queued signal pair
+        per member would flood the GUI thread's event loop.
+        """
+        if percent == self._last_progress_percent:
+            return
+
+        now = time.monotonic()
+        if percent >= 100 or now - self._last_progress_time >= self.PROGRESS_INTERVAL:
+            self.file_extracted.emit(filename)
+            self.progress.emit(percent)
+            self._last_progress_percent = percent
+            self._last_progress_time = now
+
+    def _output_path(self, file_info: zipfile.ZipInfo) -> str:
+        """Map an archive member to its path under the extraction directory
+
+        Absolute paths, drive letters and "." / ".." components are dropped
+        the same way ZipFile.extract does, so no entry can land outside
+        extract_to.
+        """
+        name = file_info.filename.replace("\\", "/")
+        parts = [
+            part
+            for part in os.path.splitdrive(name)[1].split("/")
+            if part not in ("", ".", "..")
+        ]
+        return self._extract_base + os.sep.join(parts)
+
+    def _zip_handle(self) -> zipfile.ZipFile:
+        """Get the calling thread's own handle on the archive"""
+        zip_ref = getattr(self._local, "zip_ref", None)
+        if zip_ref is None:
+            zip_ref = zipfile.ZipFile(self.zip_path, "r")
+            self._local.zip_ref = zip_ref
+            with self._handles_lock:
+                self._handles.append(zip_ref)
+        return zip_ref
+
+    def _close_handles(self):
+        """Close the archive handles opened by the extraction threads"""
+        with self._handles_lock:
+            handles, self._handles = self._handles, []
+        for zip_ref in handles:
+            zip_ref.close()
+
+    def _extract_entry(
+        self, file_info: zipfile.ZipInfo, out_path: str
+    ) -> Optional[str]:
+        """Stream one archive member to out_path and return that path
+
+        The member's directory must already exist. A file already holding
+        the member's size and archived modification time is left as is, so
+        extracting the same archive again is nearly free. Returns None
+        without writing anything once a stop is requested.
+        """
+        if self.should_stop:
+            return None
+
+        if file_info.is_dir():
+            return out_path
+
+        try:
+            mtime = time.mktime(file_info.date_time + (0, 0, -1))
+        except (OverflowError, ValueError):
+            mtime = None
+
+        if mtime is not None:
+            try:
+                st = os.stat(out_path)
+                if st.st_size == file_info.file_size and int(st.st_mtime) == int(mtime):
+                    return out_path
+            except OSError:
+                pass
+
+        # Reading through ZipFile checks each member's CRC-32 as it goes
+        with (
+            self._zip_handle().open(file_info) as src,
+            open(out_path, "wb") as dst,
+        ):
+            self._preallocate(dst, file_info.file_size)
+            shutil.copyfileobj(src, dst, EXTRACT_CHUNK_SIZE)
+
+        # Keep the archived modification time rather than the extraction time
+        if mtime is not None:
+            try:
+                os.utime(out_path, (mtime, mtime))
+            except OSError:
+                pass
+        return out_path
+
+    def _preallocate(self, dst, size: int):
+        """Reserve a large member's full size before writing it
+
+        Allocating the extent in one go keeps a multi-GB ISO from being
+        grown (and fragmented) a chunk at a time.
+        """
+        if size > PREALLOCATE_MIN_SIZE and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(dst.fileno(), 0, size)
+            except OSError:
+                pass
+
     def stop(self):
         """Stop the extraction process"""
         self.should_stop = True